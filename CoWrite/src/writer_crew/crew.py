@@ -1,11 +1,14 @@
+import os
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
 # Import tools directly
-# from .tools.search_tools import web_search_tool # No longer importing the instance
-from crewai_tools import SerperDevTool # Import the class
+from .tools.search_tools import web_search_tool, verify_claims # Shared instance, built once at import
 from .tools.file_tools import file_reading_tool
 
+# Keep crew memory in one stable place regardless of the working directory (override via env)
+os.environ.setdefault("CREWAI_STORAGE_DIR", "cowrite")
+
 # If you want to run a snippet of code before or after the crew starts, 
 # you can use the @before_kickoff and @after_kickoff decorators
 # https://docs.crewai.com/concepts/crews#example-crew-class-with-decorators
@@ -24,17 +27,10 @@ class WriterCrew():
 	# https://docs.crewai.com/concepts/agents#agent-tools
 	@agent
 	def researcher(self) -> Agent:
-		# Instantiate SerperDevTool directly here
-		try:
-			search_tool_instance = SerperDevTool()
-		except Exception as e:
-			print(f"Error instantiating SerperDevTool in researcher agent: {e}")
-			search_tool_instance = None
-
 		# Compile the list of tools, adding only those that were successfully instantiated
 		available_tools = []
-		if search_tool_instance:
-			available_tools.append(search_tool_instance)
+		if web_search_tool:
+			available_tools.append(web_search_tool)
 		if file_reading_tool:
 			available_tools.append(file_reading_tool)
 
@@ -70,17 +66,11 @@ class WriterCrew():
 
 	@agent
 	def fact_checker(self) -> Agent:
-		# Instantiate SerperDevTool directly here as well for consistency
-		try:
-			search_tool_instance = SerperDevTool()
-		except Exception as e:
-			print(f"Error instantiating SerperDevTool in fact_checker agent: {e}")
-			search_tool_instance = None
-
 		# Fact checker needs web search to verify claims against external sources
 		available_tools = []
-		if search_tool_instance:
-			available_tools.append(search_tool_instance)
+		if web_search_tool:
+			# Batch verifier first: it checks every claim concurrently in a single tool call
+			available_tools.extend([verify_claims, web_search_tool])
 		# Potentially add file_reading_tool if needed later
 
 		return Agent(
@@ -89,6 +79,14 @@ class WriterCrew():
 			verbose=True
 		)
 
+	@agent
+	def synthesizer(self) -> Agent:
+		return Agent(
+			config=self.agents_config['synthesizer'],
+			verbose=True
+			# Tools not needed, merges editor and fact-checker outputs from context
+		)
+
 	# To learn more about structured task outputs, 
 	# task dependencies, and task callbacks, check out the documentation:
 	# https://docs.crewai.com/concepts/tasks#overview-of-a-task
@@ -117,14 +115,23 @@ class WriterCrew():
 	def editing_task(self) -> Task:
 		return Task(
 			config=self.tasks_config['editing_task'],
-			# Agent and context are specified in YAML
+			# Runs concurrently with fact_checking_task; both only need the draft
+			async_execution=True,
 		)
 
 	@task
 	def fact_checking_task(self) -> Task:
 		return Task(
 			config=self.tasks_config['fact_checking_task'],
-			# Agent and context are specified in YAML
+			# Runs concurrently with editing_task; both only need the draft
+			async_execution=True,
+		)
+
+	@task
+	def final_merge_task(self) -> Task:
+		return Task(
+			config=self.tasks_config['final_merge_task'],
+			# Waits on editing_task and fact_checking_task via its YAML context
 		)
 
 	@crew
@@ -134,10 +141,14 @@ class WriterCrew():
 		# https://docs.crewai.com/concepts/knowledge#what-is-knowledge
 
 		return Crew(
-			# Explicitly define agents and tasks in sequence
-			agents=[self.researcher(), self.outliner(), self.writer(), self.editor(), self.fact_checker()],
-			tasks=[self.research_task(), self.outlining_task(), self.drafting_task(), self.editing_task(), self.fact_checking_task()],
+			# Collected by @agent/@task, which memoize each factory so every agent is built once
+			# (tasks run in the order they are defined above)
+			agents=self.agents,
+			tasks=self.tasks,
 			process=Process.sequential,
 			verbose=True,
+			cache=True, # Reuse tool results across agents (see search_tools.CachedSerperDevTool)
+			memory=True, # Recall earlier research across runs instead of re-searching it
+			embedder={"provider": "openai", "config": {"model": "text-embedding-3-small"}},
 			# process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
 		)
@@ -3,26 +3,235 @@
 This module provides tools related to searching external resources, primarily web search.
 """
 
+import functools
+import hashlib
+import json
 import os
+import sqlite3
+import threading
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from crewai.tools import tool
 from crewai_tools import SerperDevTool
 
 # Note: Requires the SERPER_API_KEY environment variable to be set.
 # You can get a key from https://serper.dev
 # Consider using a .env file to manage environment variables.
 
-try:
-    # Instantiate the SerperDevTool
-    # This tool performs web searches using the Serper.dev API.
-    web_search_tool = SerperDevTool()
 
-    # You could add more tools here, e.g., for specific website searches
-    # or other search APIs if needed later.
+# In-memory memo of raw Serper responses, shared by every agent in the process.
+# The researcher and fact_checker often issue the same queries within one run.
+_RESPONSE_CACHE_SIZE = 512
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
 
-except Exception as e:
-    print(f"Error instantiating search tools: {e}")
-    print("Please ensure the SERPER_API_KEY environment variable is set correctly.")
-    # Set tool to None or raise an error to prevent use if initialization fails
-    web_search_tool = None
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share a cache entry."""
+    return " ".join(str(query).lower().split())
+
+
+def _cache_search_result(_args=None, result=None) -> bool:
+    """CrewAI cache_function: only keep non-empty search results in the crew cache."""
+    return bool(result)
+
+
+class SearchResultCache:
+    """
+    Persistent SQLite-backed cache of Serper responses with a time-to-live.
+    Survives across processes, so re-running the crew on the same topic
+    does not repeat searches that were already paid for.
+    """
+
+    def __init__(self, path, ttl_seconds: int = 86400):
+        self.path = Path(path).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS serper_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, expires FROM serper_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Error reading search cache: {e}")
+                return None
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value) -> None:
+        """Store value under key until the TTL expires."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO serper_cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + self.ttl_seconds),
+                )
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Error writing search cache: {e}")
+
+
+# Location and lifetime can be overridden through the environment.
+search_result_cache = SearchResultCache(
+    Path(os.getenv("COWRITE_CACHE_DIR", "~/.cowrite")) / "serper_cache.sqlite3",
+    ttl_seconds=int(os.getenv("SERPER_CACHE_TTL", "86400")),
+)
+
+
+SERPER_BASE_URL = "https://google.serper.dev"
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive session used for Serper calls.
+    Pooling connections avoids a fresh TCP/TLS handshake on every search.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}), # Serper searches are idempotent POSTs
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update({"content-type": "application/json"})
+    return session
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """
+    SerperDevTool that memoizes API responses per normalized query.
+    Repeated searches are answered from memory, then from the on-disk cache,
+    before falling back to the Serper API.
+    """
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        key = (_normalize_query(search_query), search_type, self.n_results)
+        with _response_cache_lock:
+            if key in _response_cache:
+                _response_cache.move_to_end(key)
+                return _response_cache[key]
+
+        disk_key = hashlib.sha256("|".join(map(str, key)).encode("utf-8")).hexdigest()
+        results = search_result_cache.get(disk_key)
+        if results is None:
+            results = self._pooled_request(search_query, search_type)
+            search_result_cache.set(disk_key, results)
+
+        with _response_cache_lock:
+            _response_cache[key] = results
+            if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+        return results
+
+    def _pooled_request(self, search_query: str, search_type: str) -> dict:
+        """Call the Serper API through the shared pooled session."""
+        payload = {"q": search_query, "num": self.n_results}
+        for field, param in (("country", "gl"), ("location", "location"), ("locale", "hl")):
+            value = getattr(self, field, "")
+            if value:
+                payload[param] = value
+        response = get_http_session().post(
+            f"{SERPER_BASE_URL}/{search_type}",
+            headers={"X-API-KEY": os.environ["SERPER_API_KEY"]},
+            json=payload,
+            timeout=10,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+@functools.lru_cache(maxsize=1)
+def get_web_search_tool():
+    """
+    Return the shared search tool instance, creating it on first use.
+    Every agent reuses this one instance instead of constructing its own.
+    """
+    try:
+        # Instantiate the cached SerperDevTool
+        # This tool performs web searches using the Serper.dev API.
+        return CachedSerperDevTool(cache_function=_cache_search_result)
+    except Exception as e:
+        print(f"Error instantiating search tools: {e}")
+        print("Please ensure the SERPER_API_KEY environment variable is set correctly.")
+        # Return None to prevent use if initialization fails
+        return None
+
+
+web_search_tool = get_web_search_tool()
+
+
+# Claim checks are independent, so they are searched side by side.
+# Bounded to stay well inside Serper's rate limits.
+_CLAIM_CHECK_CONCURRENCY = 10
+_MAX_CLAIMS_PER_CALL = 25
+_CLAIM_PREFIX = re.compile(r"^\s*(?:[-*\u2022]|\d+[.)](?=\s))\s*")
+
+
+def _parse_claims(claims: str) -> list:
+    """Split a newline-separated claim list, dropping bullets, numbering and duplicates."""
+    parsed = []
+    seen = set()
+    for line in claims.splitlines():
+        claim = _CLAIM_PREFIX.sub("", line).strip()
+        if claim and _normalize_query(claim) not in seen:
+            seen.add(_normalize_query(claim))
+            parsed.append(claim)
+    return parsed[:_MAX_CLAIMS_PER_CALL]
+
+
+def _search_claim(claim: str) -> str:
+    try:
+        return str(web_search_tool.run(search_query=claim))
+    except Exception as e:
+        return f"Search failed: {e}"
+
+
+@tool("Batch Claim Verifier")
+def verify_claims(claims: str) -> str:
+    """
+    Search the web for evidence on many factual claims in one call.
+    Pass the claims as a newline-separated list, one atomic claim per line.
+    Returns the search evidence for each claim, in the same order.
+    """
+    if web_search_tool is None:
+        return "Error: web search is unavailable (check SERPER_API_KEY)."
+    claim_list = _parse_claims(claims)
+    if not claim_list:
+        return "Error: no claims provided."
+    with ThreadPoolExecutor(max_workers=min(_CLAIM_CHECK_CONCURRENCY, len(claim_list))) as executor:
+        evidence = list(executor.map(_search_claim, claim_list))
+    return "\n\n".join(
+        f"Claim {i}: {claim}\nEvidence:\n{result}"
+        for i, (claim, result) in enumerate(zip(claim_list, evidence), start=1)
+    )
+
+# You could add more tools here, e.g., for specific website searches
+# or other search APIs if needed later.
 
 # Example of how to potentially add more tools later:
 # from crewai_tools import WebsiteSearchTool
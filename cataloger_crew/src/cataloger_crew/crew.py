@@ -3,28 +3,39 @@ Cataloger Crew - Autonomous web cataloging AI crew using CrewAI with Ollama mode
 """
 
 import os
+import copy
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List
 
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool, WebsiteSearchTool
+from crewai_tools import WebsiteSearchTool
 
 # Import custom tools
-from .tools.search_tools import enhanced_web_search, evolve_search_queries, plan_search_strategy
+from .tools.search_tools import enhanced_web_search, evolve_search_queries, plan_search_strategy, get_serper_tool
 from .tools.analysis_tools import analyze_content_quality, extract_metadata, generate_tags
 from .tools.catalog_tools import create_catalog_entry, detect_duplicates, export_catalog, generate_catalog_statistics
 
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Parse a yaml file once per process; later calls return the cached result."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+@functools.lru_cache(maxsize=None)
 def load_ollama_config() -> Dict[str, Any]:
-    """Load Ollama configuration from yaml file."""
+    """
+    Load Ollama configuration from yaml file.
+    The result is cached, so callers that modify it must work on a copy.
+    """
     config_path = Path(__file__).parent.parent.parent / "ollama_config.yaml"
     
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        return _load_yaml(str(config_path))
     else:
         # Default configuration
         return {
@@ -33,41 +44,72 @@ def load_ollama_config() -> Dict[str, Any]:
                 "analysis_model": "llama3.1:8b", 
                 "cataloger_model": "llama3.1:8b"
             },
-            "ollama_host": "http://localhost:11434"
+            "ollama_host": "http://localhost:11434",
+            "llm_provider": "ollama"
         }
 
 
+@functools.lru_cache(maxsize=None)
+def get_shared_llm(model: str, base_url: str, timeout: int = 60) -> LLM:
+    """
+    Return one LLM handle per (model, server) pair for the whole process.
+    Agents that run the same Ollama model share a client instead of each
+    building their own.
+    """
+    return LLM(model=model, base_url=base_url, timeout=timeout)
+
+
 @CrewBase
 class CatalogerCrew:
     """Cataloger crew for autonomous web content cataloging."""
     
     def __init__(self):
-        # Load configuration
-        self.config = load_ollama_config()
+        # Load configuration (copied, since create_cataloger_crew overrides models per instance)
+        self.config = copy.deepcopy(load_ollama_config())
         self.agents_config = self._load_config('agents.yaml')
         self.tasks_config = self._load_config('tasks.yaml')
         
         # Set up Ollama environment if needed
         if 'OLLAMA_BASE_URL' not in os.environ:
             os.environ['OLLAMA_BASE_URL'] = self.config.get('ollama_host', 'http://localhost:11434')
+        
+        # Build tools once; WebsiteSearchTool loads an embedder on init, so agents share these instances
+        self._serper = get_serper_tool()
+        self._website = WebsiteSearchTool()
     
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from yaml file."""
         config_path = Path(__file__).parent / 'config' / config_file
         
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return copy.deepcopy(_load_yaml(str(config_path)))
         else:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
+    def _llm_for(self, config: Dict[str, Any], model_key: str) -> LLM:
+        """Resolve an agent's llm template to the shared handle for its configured model."""
+        timeout = self.config.get('ollama_timeout', 60)
+        if self.config.get('llm_provider', 'ollama') == 'vllm':
+            # OpenAI-compatible vLLM server; continuous batching serves concurrent agents together
+            return get_shared_llm(
+                f"hosted_vllm/{self.config['models'][model_key]}",
+                self.config.get('vllm_base_url', 'http://localhost:8000/v1'),
+                timeout
+            )
+        model = config['llm'].format(**{model_key: self.config['models'][model_key]})
+        return get_shared_llm(
+            model,
+            self.config.get('ollama_host', 'http://localhost:11434'),
+            timeout
+        )
+    
     @agent
     def search_agent(self) -> Agent:
         """Create the search agent with Ollama model."""
         config = self.agents_config['search_agent']
         
-        # Format LLM with model from config
-        llm = config['llm'].format(search_model=self.config['models']['search_model'])
+        # Shared LLM handle for the configured model
+        llm = self._llm_for(config, 'search_model')
         
         return Agent(
             config=config,
@@ -76,7 +118,7 @@ class CatalogerCrew:
                 enhanced_web_search,
                 evolve_search_queries,
                 plan_search_strategy,
-                SerperDevTool()
+                self._serper
             ],
             verbose=True
         )
@@ -86,8 +128,8 @@ class CatalogerCrew:
         """Create the analysis agent with Ollama model."""
         config = self.agents_config['analysis_agent']
         
-        # Format LLM with model from config
-        llm = config['llm'].format(analysis_model=self.config['models']['analysis_model'])
+        # Shared LLM handle for the configured model
+        llm = self._llm_for(config, 'analysis_model')
         
         return Agent(
             config=config,
@@ -96,8 +138,8 @@ class CatalogerCrew:
                 analyze_content_quality,
                 extract_metadata,
                 generate_tags,
-                SerperDevTool(),  # For additional research if needed
-                WebsiteSearchTool()  # For content scraping
+                self._serper,  # For additional research if needed
+                self._website  # For content scraping
             ],
             verbose=True
         )
@@ -107,8 +149,8 @@ class CatalogerCrew:
         """Create the cataloger agent with Ollama model."""
         config = self.agents_config['cataloger_agent']
         
-        # Format LLM with model from config
-        llm = config['llm'].format(cataloger_model=self.config['models']['cataloger_model'])
+        # Shared LLM handle for the configured model
+        llm = self._llm_for(config, 'cataloger_model')
         
         return Agent(
             config=config,
@@ -158,7 +200,12 @@ class CatalogerCrew:
             verbose=True,
             memory=True,  # Enable crew memory for learning
             planning=True,  # Enable planning for autonomous operation
-            planning_llm=self.config['models']['cataloger_model']  # Use cataloger model for planning
+            # Plan with the cataloger agent's LLM, so planning uses the same backend (Ollama or vLLM)
+            planning_llm=self._llm_for(self.agents_config['cataloger_agent'], 'cataloger_model'),
+            # Applies per crew copy: kickoff_for_each_async copies the crew for every
+            # input, so a session can reach search_rounds x max_rpm requests per minute
+            # (and run_batch multiplies that by performance.concurrent_requests)
+            max_rpm=self.config.get('performance', {}).get('max_rpm')
         )
 
 
@@ -168,7 +215,8 @@ def create_cataloger_crew(
     search_rounds: int = 3,
     search_model: str = None,
     analysis_model: str = None,
-    cataloger_model: str = None
+    cataloger_model: str = None,
+    max_rpm: int = None
 ) -> CatalogerCrew:
     """
     Create a cataloger crew with specified parameters.
@@ -180,6 +228,7 @@ def create_cataloger_crew(
         search_model: Override search model
         analysis_model: Override analysis model
         cataloger_model: Override cataloger model
+        max_rpm: Override the requests-per-minute cap of each crew copy (one per search round)
     
     Returns:
         Configured CatalogerCrew instance
@@ -193,6 +242,8 @@ def create_cataloger_crew(
         crew_instance.config['models']['analysis_model'] = analysis_model
     if cataloger_model:
         crew_instance.config['models']['cataloger_model'] = cataloger_model
+    if max_rpm:
+        crew_instance.config.setdefault('performance', {})['max_rpm'] = max_rpm
     
     # Store parameters for task execution
     crew_instance.topic = topic
@@ -6,34 +6,73 @@ Configure and run autonomous web cataloging operations.
 import os
 import sys
 import time
-import schedule
+import asyncio
+import functools
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from dotenv import load_dotenv
 
 # Add the src directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from cataloger_crew.crew import create_cataloger_crew
+from cataloger_crew.crew import CatalogerCrew, create_cataloger_crew, load_ollama_config
+from cataloger_crew.tools.catalog_tools import catalog_manager
 
 
-def load_environment():
-    """Load environment variables from .env file if it exists."""
+@functools.lru_cache(maxsize=1)
+def load_environment() -> bool:
+    """
+    Load environment variables from .env file if it exists.
+    Cached so restarts within one process never re-read the file;
+    variables already present in the environment are left untouched.
+    """
     env_file = Path(__file__).parent.parent.parent / '.env'
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value.strip('"\'')
+    return load_dotenv(env_file, override=False)
+
+
+def build_cataloger_crew(config: Dict[str, Any]) -> CatalogerCrew:
+    """Create a cataloger crew from a session configuration dictionary."""
+    return create_cataloger_crew(
+        topic=config['topic'],
+        search_terms=config['search_terms'],
+        search_rounds=config.get('search_rounds', 3),
+        search_model=config.get('search_model'),
+        analysis_model=config.get('analysis_model'),
+        cataloger_model=config.get('cataloger_model'),
+        max_rpm=config.get('max_rpm')
+    )
+
+
+def summarize_outputs(outputs: List[Any], limit: int = 500) -> str:
+    """
+    Build a short summary from crew outputs without stringifying them in full.
+    Reads each output's raw text directly and stops once the limit is reached.
+    """
+    parts = []
+    remaining = limit
+    truncated = False
+    for output in outputs:
+        raw = getattr(output, 'raw', None) or ''
+        if remaining <= 0:
+            truncated = truncated or bool(raw)
+            break
+        parts.append(raw[:remaining])
+        if len(raw) > remaining:
+            truncated = True
+        remaining -= len(parts[-1]) + 2
+    summary = "\n\n".join(parts)
+    return summary + "..." if truncated else summary
 
 
-def run_cataloger_session(config: Dict[str, Any]) -> Dict[str, Any]:
+async def run_cataloger_session(config: Dict[str, Any], crew: Optional[CatalogerCrew] = None) -> Dict[str, Any]:
     """
     Run a single cataloging session.
     
     Args:
         config: Configuration dictionary with cataloging parameters
+        crew: Existing crew to reuse; a new one is built from config if omitted
     
     Returns:
         Session results and statistics
@@ -45,26 +84,25 @@ def run_cataloger_session(config: Dict[str, Any]) -> Dict[str, Any]:
     print(f"{'='*60}\n")
     
     try:
-        # Create and configure crew
-        crew = create_cataloger_crew(
-            topic=config['topic'],
-            search_terms=config['search_terms'],
-            search_rounds=config.get('search_rounds', 3),
-            search_model=config.get('search_model'),
-            analysis_model=config.get('analysis_model'),
-            cataloger_model=config.get('cataloger_model')
-        )
+        # Create and configure crew unless the caller is reusing one
+        if crew is None:
+            crew = build_cataloger_crew(config)
         
-        # Prepare inputs for the crew
-        inputs = {
-            'topic': config['topic'],
-            'search_terms': config['search_terms'],
-            'search_rounds': config.get('search_rounds', 3)
-        }
+        # Prepare one input set per search round so the rounds run in parallel
+        search_rounds = config.get('search_rounds', 3)
+        inputs_list = [
+            {
+                'topic': config['topic'],
+                'search_terms': config['search_terms'],
+                'search_rounds': search_rounds,
+                'round_idx': round_idx
+            }
+            for round_idx in range(1, search_rounds + 1)
+        ]
         
-        # Run the crew
+        # Run the crew once per round and merge the round outputs
         start_time = time.time()
-        result = crew.crew().kickoff(inputs=inputs)
+        round_results = await crew.crew().kickoff_for_each_async(inputs=inputs_list)
         end_time = time.time()
         
         # Session statistics
@@ -72,9 +110,10 @@ def run_cataloger_session(config: Dict[str, Any]) -> Dict[str, Any]:
             'session_start': datetime.now().isoformat(),
             'duration_minutes': (end_time - start_time) / 60,
             'topic': config['topic'],
-            'search_rounds': config.get('search_rounds', 3),
+            'search_rounds': search_rounds,
+            'rounds_completed': len(round_results),
             'success': True,
-            'result_summary': str(result)[:500] + "..." if len(str(result)) > 500 else str(result)
+            'result_summary': summarize_outputs(round_results)
         }
         
         print(f"\n{'='*60}")
@@ -94,9 +133,39 @@ def run_cataloger_session(config: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def run_autonomous_cataloger(config: Dict[str, Any]):
+async def run_batch(topics: List[Dict[str, Any]], max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run cataloging sessions for many topics concurrently.
+    
+    Args:
+        topics: One session configuration dictionary per topic
+        max_concurrency: Sessions allowed in flight at once; defaults to
+            performance.concurrent_requests from ollama_config.yaml
+    
+    Returns:
+        Session results in the same order as topics
+    """
+    if max_concurrency is None:
+        max_concurrency = load_ollama_config().get('performance', {}).get('concurrent_requests', 2)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    print(f"\n📚 Starting batch of {len(topics)} topics ({max_concurrency} at a time)")
+    
+    async def throttled_session(topic_config: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_cataloger_session(topic_config)
+    
+    results = await asyncio.gather(*(throttled_session(topic_config) for topic_config in topics))
+    
+    successful = sum(1 for r in results if r['success'])
+    print(f"\n📊 Batch finished: {successful}/{len(results)} sessions successful")
+    return results
+
+
+async def run_autonomous_cataloger(config: Dict[str, Any]):
     """
     Run the cataloger in autonomous mode with scheduled sessions.
+    Sessions are timed with asyncio.sleep until the next run instead of polling.
     
     Args:
         config: Configuration dictionary with cataloging and scheduling parameters
@@ -117,53 +186,64 @@ def run_autonomous_cataloger(config: Dict[str, Any]):
     end_time = start_time + timedelta(hours=config.get('duration_hours', 24))
     
     session_count = 0
-    session_history = []
+    success_count = 0
+    fail_count = 0
+    total_success_minutes = 0.0
+    # Bounded history for long deployments; totals are tracked by the counters above
+    session_history = deque(maxlen=1000)
     
-    # Schedule function for sessions
-    def scheduled_session():
-        nonlocal session_count, session_history
+    # Build the crew once and reuse it for every scheduled session
+    crew = build_cataloger_crew(config)
+    
+    # Scheduled session runner
+    async def scheduled_session():
+        nonlocal session_count, success_count, fail_count, total_success_minutes
         session_count += 1
         
         print(f"\n🤖 Starting Scheduled Session #{session_count}")
         print(f"⏰ Current Time: {datetime.now().isoformat()}")
         
         # Run the session
-        session_result = run_cataloger_session(config)
+        session_result = await run_cataloger_session(config, crew)
         session_history.append(session_result)
+        success_count += int(session_result['success'])
+        fail_count += int(not session_result['success'])
+        if session_result['success']:
+            total_success_minutes += session_result.get('duration_minutes', 0)
         
         # Print session summary
         if session_result['success']:
             print(f"✅ Session #{session_count} completed successfully")
         else:
             print(f"❌ Session #{session_count} failed: {session_result.get('error', 'Unknown error')}")
-        
-        # Check if we should continue
-        if datetime.now() >= end_time:
-            print(f"\n🏁 Autonomous cataloging duration completed")
-            print(f"📊 Total Sessions: {session_count}")
-            print(f"✅ Successful: {sum(1 for s in session_history if s['success'])}")
-            print(f"❌ Failed: {sum(1 for s in session_history if not s['success'])}")
-            return schedule.CancelJob
-    
-    # Schedule the sessions
+    
     interval_hours = config.get('session_interval_hours', 4)
-    schedule.every(interval_hours).hours.do(scheduled_session)
+    interval = timedelta(hours=interval_hours)
     
     # Run first session immediately
     print("🚀 Running initial session...")
-    scheduled_session()
-    
-    # Main loop
-    print(f"\n⏰ Next session scheduled in {interval_hours} hours")
-    print(f"🛑 Autonomous operation will end at: {end_time.isoformat()}")
-    print(f"💡 Press Ctrl+C to stop early\n")
     
     try:
-        while datetime.now() < end_time:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        await scheduled_session()
+        
+        print(f"\n⏰ Next session scheduled in {interval_hours} hours")
+        print(f"🛑 Autonomous operation will end at: {end_time.isoformat()}")
+        print(f"💡 Press Ctrl+C to stop early\n")
+        
+        # Main loop: sleep until each next run, measured from the end of the previous session
+        while True:
+            next_run = datetime.now() + interval
+            if next_run >= end_time:
+                break
+            await asyncio.sleep((next_run - datetime.now()).total_seconds())
+            await scheduled_session()
+        
+        print(f"\n🏁 Autonomous cataloging duration completed")
+        print(f"📊 Total Sessions: {session_count}")
+        print(f"✅ Successful: {success_count}")
+        print(f"❌ Failed: {fail_count}")
             
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print(f"\n\n🛑 Autonomous cataloging stopped by user")
         print(f"📊 Sessions completed: {session_count}")
     
@@ -175,11 +255,10 @@ def run_autonomous_cataloger(config: Dict[str, Any]):
     print(f"End Time: {datetime.now().isoformat()}")
     print(f"Total Sessions: {session_count}")
     
-    if session_history:
-        successful_sessions = [s for s in session_history if s['success']]
-        print(f"Successful Sessions: {len(successful_sessions)}")
-        if successful_sessions:
-            avg_duration = sum(s.get('duration_minutes', 0) for s in successful_sessions) / len(successful_sessions)
+    if session_count:
+        print(f"Successful Sessions: {success_count}")
+        if success_count:
+            avg_duration = total_success_minutes / success_count
             print(f"Average Session Duration: {avg_duration:.2f} minutes")
     
     print(f"{'='*80}\n")
@@ -220,15 +299,37 @@ def main():
         'cataloger_model': 'llama3.1:8b'
     }
     
+    # Batch configuration - one session per topic, run concurrently
+    batch_configs = [
+        {
+            'topic': 'vector databases',
+            'search_terms': 'vector database embeddings similarity search',
+            'search_rounds': 2,
+            'max_rpm': 60
+        },
+        {
+            'topic': 'retrieval augmented generation',
+            'search_terms': 'RAG retrieval augmented generation LLM grounding',
+            'search_rounds': 2,
+            'max_rpm': 60
+        }
+    ]
+    
     # Choose mode based on command line argument or default to single session
     mode = sys.argv[1] if len(sys.argv) > 1 else 'single'
     
     if mode == 'autonomous':
         print("🤖 Starting Autonomous Cataloger Mode")
-        run_autonomous_cataloger(autonomous_config)
+        asyncio.run(run_autonomous_cataloger(autonomous_config))
+    elif mode == 'batch':
+        print("📚 Running Batch Cataloger Sessions")
+        asyncio.run(run_batch(batch_configs))
+    elif mode == 'dump':
+        # The catalog is stored as compact JSON; print an indented copy for reading
+        print(catalog_manager.pretty_dump())
     else:
         print("🔍 Running Single Cataloger Session")
-        result = run_cataloger_session(single_session_config)
+        result = asyncio.run(run_cataloger_session(single_session_config))
         
         if result['success']:
             print("\n✅ Cataloging session completed successfully!")
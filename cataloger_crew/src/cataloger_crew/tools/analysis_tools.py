@@ -4,11 +4,209 @@ Content analysis and metadata extraction tools for the cataloger crew.
 
 import re
 import json
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache, wraps
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urlparse
 from crewai import tool
 
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2 as _regex  # google-re2: linear-time matching for the hot content scans
+except ImportError:
+    _regex = re
+
+
+# URLs recur across the analyzer, metadata and tag tools for the same source
+_urlparse = lru_cache(maxsize=1024)(urlparse)
+
+# Patterns are compiled once at import instead of being looked up in re's cache on every call.
+# The hot content scans use re2 when available; patterns keep to syntax both engines accept.
+
+# Last character of each run of sentence punctuation; counting these avoids building the split list
+# (stays on re: the lookahead is not supported by re2)
+_SENTENCE_END_RE = re.compile(r'[.!?](?![.!?])')
+# Heading, list and link probes fused into one alternation so a single scan sets all three flags
+# Inline (?m) rather than re.MULTILINE, so the same pattern compiles under re2
+_STRUCTURE_RE = _regex.compile(
+    r'(?m)(?P<heading>^#{1,6}\s)'
+    r'|(?P<list>^\s*[-*+]\s)'
+    r'|(?P<link>http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+)'
+)
+_WORD_RE = _regex.compile(r'\b[A-Za-z]{4,}\b')
+# Fenced code or a line indented like a code block; one scan covers both
+_CODE_RE = _regex.compile(r'(?m)```|^(?: {4}|\t)')
+
+# Date and author patterns fused into one alternation; dispatch on the named group that matched
+_META_RE = _regex.compile(
+    r'(?P<date_long>(?i:\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b))'
+    r'|(?P<date_slash>\b\d{1,2}/\d{1,2}/\d{4}\b)'
+    r'|(?P<date_iso>\b\d{4}-\d{2}-\d{2}\b)'
+    r'|[Ww]ritten\s+by\s+(?P<author_written>[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)'
+    r'|[Aa]uthor:\s*(?P<author_label>[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)'
+    r'|[Bb]y\s+(?P<author_by>[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)'
+)
+
+
+def _structure_flags(content: str) -> tuple:
+    """Return (has_headings, has_lists, has_links) from one pass, stopping once all are found."""
+    found = set()
+    for match in _STRUCTURE_RE.finditer(content):
+        found.add(match.lastgroup)
+        if len(found) == 3:
+            break
+    return 'heading' in found, 'list' in found, 'link' in found
+
+
+# Keyword tables used by the content type, technical level and tag heuristics
+# Keyword groups are frozensets so the helpers can test them against the hit set with set operations
+_CONTENT_TYPE_INDICATORS = (
+    ("academic_paper", frozenset({'abstract', 'methodology', 'conclusion', 'references', 'doi:'})),
+    ("tutorial", frozenset({'step 1', 'tutorial', 'how to', 'guide', 'walkthrough'})),
+    ("news", frozenset({'breaking', 'reported', 'according to', 'sources say'})),
+    ("documentation", frozenset({'api', 'function', 'parameter', 'usage', 'installation'})),
+    ("blog_post", frozenset({'opinion', 'i think', 'personal', 'experience'}))
+)
+
+_TECHNICAL_TERMS = frozenset({'algorithm', 'implementation', 'architecture', 'framework', 'methodology', 'optimization', 'configuration', 'deployment', 'integration'})
+_ADVANCED_TERMS = frozenset({'quantum', 'neural', 'machine learning', 'artificial intelligence', 'cryptography', 'blockchain', 'microservices'})
+_BEGINNER_TERMS = frozenset({'introduction', 'basics', 'getting started', 'overview', 'beginner', 'simple', 'easy'})
+
+_TECH_INDICATORS = {
+    'python': ('python', 'django', 'flask', 'pandas'),
+    'javascript': ('javascript', 'react', 'node', 'vue'),
+    'data-science': ('data science', 'machine learning', 'analytics', 'statistics'),
+    'web-development': ('html', 'css', 'frontend', 'backend', 'api'),
+    'cloud': ('aws', 'azure', 'cloud', 'kubernetes', 'docker'),
+    'ai': ('artificial intelligence', 'neural network', 'deep learning')
+}
+
+_METHOD_INDICATORS = {
+    'tutorial': ('tutorial', 'step-by-step', 'how-to', 'guide'),
+    'research': ('study', 'research', 'analysis', 'findings'),
+    'case-study': ('case study', 'example', 'implementation'),
+    'comparison': ('comparison', 'versus', 'vs', 'compare'),
+    'review': ('review', 'evaluation', 'assessment')
+}
+
+# Common stop words to ignore during topic extraction
+_STOP_WORDS = frozenset({'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'about', 'would', 'there', 'could', 'other', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'can', 'still', 'should', 'after', 'being', 'now', 'made', 'before', 'here', 'through', 'when', 'where', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'only', 'own', 'same', 'than', 'too', 'very'})
+
+_MATH_INDICATORS = frozenset({'equation', 'formula', 'theorem', '=', '+', '-', '*', '/'})
+_BEGINNER_DIFFICULTY = frozenset({'beginner', 'introduction'})
+_ADVANCED_DIFFICULTY = frozenset({'advanced', 'expert'})
+_IMAGE_INDICATORS = frozenset({'image', 'figure', 'chart', 'graph'})
+
+
+def _flatten_tag_indicators() -> Dict[str, List[Tuple[str, str]]]:
+    """Map each indicator keyword to the (category, tag) labels it triggers."""
+    keyword_tags = {}
+    for category, indicator_map in (('technology', _TECH_INDICATORS), ('methodology', _METHOD_INDICATORS)):
+        for tag, indicators in indicator_map.items():
+            for keyword in indicators:
+                keyword_tags.setdefault(keyword, []).append((category, tag))
+    return keyword_tags
+
+
+# Flattened keyword -> labels, so tag buckets are filled from the hit set in one pass
+_KEYWORD_TAGS = _flatten_tag_indicators()
+
+_ALL_KEYWORDS = frozenset(
+    frozenset().union(*(indicators for _, indicators in _CONTENT_TYPE_INDICATORS))
+    | _TECHNICAL_TERMS | _ADVANCED_TERMS | _BEGINNER_TERMS
+    | frozenset(_KEYWORD_TAGS)
+    | _MATH_INDICATORS | _BEGINNER_DIFFICULTY | _ADVANCED_DIFFICULTY
+    | _IMAGE_INDICATORS | {'code'}
+)
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every heuristic keyword, if pyahocorasick is installed."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Keyword heuristics only read the start of very long documents; later text rarely changes the tags
+_KEYWORD_SCAN_LIMIT = 50_000
+
+
+def _keyword_scan_note(content: str) -> str:
+    """Report line describing the keyword scan window, or an empty string if nothing was skipped."""
+    if len(content) <= _KEYWORD_SCAN_LIMIT:
+        return ""
+    return f"- Keyword Scan Window: first {_KEYWORD_SCAN_LIMIT:,} of {len(content):,} characters\n"
+
+
+def _keyword_hits(content_lower: str) -> frozenset:
+    """
+    Return every heuristic keyword that occurs in the lowercased content.
+    One linear automaton pass replaces dozens of separate substring scans;
+    without pyahocorasick it falls back to the plain substring checks.
+    Only the first _KEYWORD_SCAN_LIMIT characters are scanned.
+    """
+    content_lower = content_lower[:_KEYWORD_SCAN_LIMIT]
+    if _KEYWORD_AUTOMATON is None:
+        return frozenset(kw for kw in _ALL_KEYWORDS if kw in content_lower)
+    return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(content_lower))
+
+
+# Report bodies for recently analyzed content; crews often re-run a tool on the same page
+_REPORT_CACHE_SIZE = 256
+
+
+def _memoize_by_content(func):
+    """
+    Cache a pure report builder on a blake2b digest of its content argument plus the other args.
+    The 16-byte digest keeps keys small and avoids holding multi-megabyte pages as cache keys.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+    
+    @wraps(func)
+    def wrapper(content: str, *args):
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        key = (digest, args)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = func(content, *args)
+        with lock:
+            cache[key] = result
+            if len(cache) > _REPORT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+    
+    return wrapper
+
+
+@_memoize_by_content
+def _analyze_basics(content: str) -> Tuple[int, int, int]:
+    """
+    Return (word_count, sentence_count, paragraph_count) for content.
+    Shared by the quality and metadata tools, which are usually run on the
+    same source back to back, so the tokenization is done once.
+    """
+    word_count = len(content.split())
+    sentence_count = len(_SENTENCE_END_RE.findall(content)) + 1  # same as len(re.split(r'[.!?]+', content))
+    paragraph_count = sum(1 for p in content.split('\n\n') if p.strip())
+    return word_count, sentence_count, paragraph_count
+
 
 @tool("Content Quality Analyzer")
 def analyze_content_quality(content: str, url: str = "") -> str:
@@ -25,10 +223,21 @@ def analyze_content_quality(content: str, url: str = "") -> str:
     if not content or len(content.strip()) < 100:
         return "Content too short for quality analysis (minimum 100 characters required)"
     
+    quality_report = f"""
+Content Quality Analysis Report
+{'=' * 40}
+Source URL: {url or 'Not provided'}
+Analysis Timestamp: {datetime.now().isoformat(timespec='seconds')}
+"""
+    
+    return quality_report + _quality_report_body(content, url)
+
+
+@_memoize_by_content
+def _quality_report_body(content: str, url: str) -> str:
+    """Build the metrics section of the quality report; depends only on content and url."""
     # Basic quality metrics
-    word_count = len(content.split())
-    sentence_count = len(re.split(r'[.!?]+', content))
-    paragraph_count = len([p for p in content.split('\n\n') if p.strip()])
+    word_count, sentence_count, paragraph_count = _analyze_basics(content)
     
     # Average sentence length
     avg_sentence_length = word_count / max(sentence_count, 1)
@@ -37,22 +246,12 @@ def analyze_content_quality(content: str, url: str = "") -> str:
     avg_sentence_length_score = min(max((avg_sentence_length - 15) / 10, 0), 1)
     
     # Content structure analysis
-    has_headings = bool(re.search(r'^#{1,6}\s', content, re.MULTILINE))
-    has_lists = bool(re.search(r'^\s*[-*+]\s', content, re.MULTILINE))
-    has_links = bool(re.search(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', content))
+    has_headings, has_lists, has_links = _structure_flags(content)
     
     # Domain authority (basic check)
     domain_authority = "unknown"
     if url:
-        domain = urlparse(url).netloc.lower()
-        if any(edu_domain in domain for edu_domain in ['.edu', '.ac.', 'university', 'college']):
-            domain_authority = "academic"
-        elif any(gov_domain in domain for gov_domain in ['.gov', '.mil']):
-            domain_authority = "government"
-        elif any(org_domain in domain for org_domain in ['.org']):
-            domain_authority = "organization"
-        else:
-            domain_authority = "commercial"
+        domain_authority = _classify_domain(_urlparse(url).hostname or "")
     
     # Calculate overall quality score (0-10)
     structure_score = (
@@ -70,12 +269,7 @@ def analyze_content_quality(content: str, url: str = "") -> str:
     if domain_authority in ["academic", "government"]:
         overall_score = min(overall_score + 1, 10)
     
-    quality_report = f"""
-Content Quality Analysis Report
-{'=' * 40}
-Source URL: {url or 'Not provided'}
-Analysis Timestamp: {datetime.now().isoformat()}
-
+    return f"""
 Content Metrics:
 - Word Count: {word_count}
 - Sentence Count: {sentence_count}
@@ -101,20 +295,36 @@ Quality Assessment:
 Recommendations:
 {_get_quality_recommendations(overall_score, word_count, has_headings, has_lists)}
 """
-    
-    return quality_report
+
+
+# Authority implied by a host label (e.g. cs.stanford.edu, www.ox.ac.uk); earlier ranks win
+_LABEL_AUTHORITY = {'edu': 'academic', 'ac': 'academic', 'gov': 'government', 'mil': 'government', 'org': 'organization'}
+_AUTHORITY_RANK = ('academic', 'government', 'organization')
+_ACADEMIC_NAME_HINTS = ('university', 'college')
+
+
+@lru_cache(maxsize=1024)
+def _classify_domain(domain: str) -> str:
+    """Classify a host as academic, government, organization or commercial with one split and dict lookups."""
+    if any(hint in domain for hint in _ACADEMIC_NAME_HINTS):
+        return "academic"
+    authorities = {_LABEL_AUTHORITY.get(label) for label in domain.split('.')[1:]}
+    return next((authority for authority in _AUTHORITY_RANK if authority in authorities), "commercial")
+
+
+# Lower bounds of the Fair, Good and Excellent bands; bisect_right maps a score to its band
+_QUALITY_THRESHOLDS = (4, 6, 8)
+_QUALITY_ASSESSMENTS = (
+    "Poor - Below minimum quality standards",
+    "Fair - Meets minimum standards but could be improved",
+    "Good - Acceptable quality with minor issues",
+    "Excellent - High-quality content suitable for cataloging"
+)
 
 
 def _get_quality_assessment(score: float) -> str:
     """Get quality assessment based on score."""
-    if score >= 8:
-        return "Excellent - High-quality content suitable for cataloging"
-    elif score >= 6:
-        return "Good - Acceptable quality with minor issues"
-    elif score >= 4:
-        return "Fair - Meets minimum standards but could be improved"
-    else:
-        return "Poor - Below minimum quality standards"
+    return _QUALITY_ASSESSMENTS[bisect_right(_QUALITY_THRESHOLDS, score)]
 
 
 def _get_quality_recommendations(score: float, word_count: int, has_headings: bool, has_lists: bool) -> str:
@@ -155,56 +365,56 @@ def extract_metadata(content: str, url: str = "", title: str = "") -> str:
     if not content:
         return "No content provided for metadata extraction"
     
+    metadata_report = f"""
+Extracted Metadata
+{'=' * 30}
+Extraction Timestamp: {datetime.now().isoformat(timespec='seconds')}
+Source URL: {url or 'Not provided'}
+Title: {title or 'Not provided'}
+"""
+    
+    return metadata_report + _metadata_report_body(content, url)
+
+
+@_memoize_by_content
+def _metadata_report_body(content: str, url: str) -> str:
+    """Build the extracted metadata sections; depends only on content and url."""
     # Basic content analysis
-    word_count = len(content.split())
+    word_count, _, _ = _analyze_basics(content)
     estimated_reading_time = max(1, word_count // 200)  # ~200 words per minute
     
-    # Extract potential dates
-    date_patterns = [
-        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b',
-        r'\b\d{1,2}/\d{1,2}/\d{4}\b',
-        r'\b\d{4}-\d{2}-\d{2}\b'
-    ]
-    
+    # Extract potential dates and authors in a single scan
     found_dates = []
-    for pattern in date_patterns:
-        dates = re.findall(pattern, content, re.IGNORECASE)
-        found_dates.extend(dates)
-    
-    # Extract potential authors
-    author_patterns = [
-        r'[Bb]y\s+([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)',
-        r'[Aa]uthor:\s*([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)',
-        r'[Ww]ritten\s+by\s+([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)'
-    ]
-    
     potential_authors = []
-    for pattern in author_patterns:
-        authors = re.findall(pattern, content)
-        potential_authors.extend(authors)
+    for match in _META_RE.finditer(content):
+        group = match.lastgroup
+        if group.startswith('date_'):
+            found_dates.append(match.group(group))
+        else:
+            potential_authors.append(match.group(group))
+    
+    # Lowercase once; every keyword heuristic below reads from one scan of it
+    content_lower = content.lower()
+    keyword_hits = _keyword_hits(content_lower)
     
     # Content type detection
-    content_type = _detect_content_type(content, url)
+    content_type = _detect_content_type(keyword_hits, url)
     
     # Topic extraction (simplified keyword extraction)
-    topics = _extract_topics(content)
+    topics = _extract_topics(content_lower)
     
     # Technical level assessment
-    technical_level = _assess_technical_level(content)
+    technical_level = _assess_technical_level(keyword_hits)
     
-    metadata_report = f"""
-Extracted Metadata
-{'=' * 30}
-Extraction Timestamp: {datetime.now().isoformat()}
-Source URL: {url or 'Not provided'}
-Title: {title or 'Not provided'}
-
+    parsed_url = _urlparse(url) if url else None
+    
+    return f"""
 Content Characteristics:
 - Content Type: {content_type}
 - Word Count: {word_count}
 - Estimated Reading Time: {estimated_reading_time} minutes
 - Technical Level: {technical_level}
-
+{_keyword_scan_note(content)}
 Temporal Information:
 - Potential Dates Found: {len(found_dates)}
 {('- Dates: ' + ', '.join(found_dates[:3])) if found_dates else '- No dates detected'}
@@ -217,79 +427,45 @@ Topics and Keywords:
 {chr(10).join(f'- {topic}' for topic in topics[:10])}
 
 Source Analysis:
-- Domain: {urlparse(url).netloc if url else 'Not provided'}
-- URL Path Depth: {len(urlparse(url).path.split('/')) - 1 if url else 0}
+- Domain: {parsed_url.netloc if parsed_url else 'Not provided'}
+- URL Path Depth: {len(parsed_url.path.split('/')) - 1 if parsed_url else 0}
 
 Content Structure:
-- Has Code Blocks: {'Yes' if '```' in content or '    ' in content else 'No'}
-- Has Mathematical Content: {'Yes' if any(math_indicator in content.lower() for math_indicator in ['equation', 'formula', 'theorem', '=', '+', '-', '*', '/']) else 'No'}
+- Has Code Blocks: {'Yes' if _CODE_RE.search(content) else 'No'}
+- Has Mathematical Content: {'No' if _MATH_INDICATORS.isdisjoint(keyword_hits) else 'Yes'}
 - Has Citations: {'Yes' if '[' in content and ']' in content else 'No'}
 """
-    
-    return metadata_report
 
 
-def _detect_content_type(content: str, url: str = "") -> str:
+def _detect_content_type(keyword_hits: frozenset, url: str = "") -> str:
     """Detect the type of content based on content and URL patterns."""
-    content_lower = content.lower()
-    
-    # Academic/Research indicators
-    if any(indicator in content_lower for indicator in ['abstract', 'methodology', 'conclusion', 'references', 'doi:']):
-        return "academic_paper"
-    
-    # Tutorial/Guide indicators
-    if any(indicator in content_lower for indicator in ['step 1', 'tutorial', 'how to', 'guide', 'walkthrough']):
-        return "tutorial"
-    
-    # News indicators
-    if any(indicator in content_lower for indicator in ['breaking', 'reported', 'according to', 'sources say']):
-        return "news"
-    
-    # Documentation indicators
-    if any(indicator in content_lower for indicator in ['api', 'function', 'parameter', 'usage', 'installation']):
-        return "documentation"
-    
-    # Blog post indicators
-    if any(indicator in content_lower for indicator in ['opinion', 'i think', 'personal', 'experience']):
-        return "blog_post"
+    # Indicators are checked in priority order: academic, tutorial, news, documentation, blog post
+    for content_type, indicators in _CONTENT_TYPE_INDICATORS:
+        if not indicators.isdisjoint(keyword_hits):
+            return content_type
     
     return "article"
 
 
-def _extract_topics(content: str) -> List[str]:
-    """Extract potential topics and keywords from content."""
+def _extract_topics(content_lower: str) -> List[str]:
+    """Extract potential topics and keywords from already-lowercased content."""
     # Simple keyword extraction - in a real implementation, you might use NLP libraries
-    words = re.findall(r'\b[A-Za-z]{4,}\b', content.lower())
-    word_freq = {}
+    words = _WORD_RE.findall(content_lower)
     
-    # Common stop words to ignore
-    stop_words = {'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'about', 'would', 'there', 'could', 'other', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'also', 'your', 'work', 'life', 'only', 'can', 'still', 'should', 'after', 'being', 'now', 'made', 'before', 'here', 'through', 'when', 'where', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'only', 'own', 'same', 'than', 'too', 'very'}
-    
-    for word in words:
-        if word not in stop_words and len(word) >= 4:
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # Return top keywords by frequency
-    sorted_topics = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [topic[0] for topic in sorted_topics[:15]]
+    # Top keywords by frequency; most_common uses a heap rather than sorting every word
+    word_freq = Counter(word for word in words if word not in _STOP_WORDS)
+    return [word for word, _ in word_freq.most_common(15)]
 
 
-def _assess_technical_level(content: str) -> str:
+def _assess_technical_level(keyword_hits: frozenset) -> str:
     """Assess the technical difficulty level of content."""
-    content_lower = content.lower()
-    
-    # Technical indicators
-    technical_terms = ['algorithm', 'implementation', 'architecture', 'framework', 'methodology', 'optimization', 'configuration', 'deployment', 'integration']
-    advanced_terms = ['quantum', 'neural', 'machine learning', 'artificial intelligence', 'cryptography', 'blockchain', 'microservices']
-    beginner_terms = ['introduction', 'basics', 'getting started', 'overview', 'beginner', 'simple', 'easy']
-    
-    technical_count = sum(1 for term in technical_terms if term in content_lower)
-    advanced_count = sum(1 for term in advanced_terms if term in content_lower)
-    beginner_count = sum(1 for term in beginner_terms if term in content_lower)
+    # Set intersections count matches at C speed; beginner terms are only consulted if still undecided
+    advanced_count = len(_ADVANCED_TERMS & keyword_hits)
+    technical_count = len(_TECHNICAL_TERMS & keyword_hits)
     
     if advanced_count >= 2 or technical_count >= 5:
         return "advanced"
-    elif technical_count >= 2 or beginner_count == 0:
+    elif technical_count >= 2 or _BEGINNER_TERMS.isdisjoint(keyword_hits):
         return "intermediate"
     else:
         return "beginner"
@@ -311,55 +487,47 @@ def generate_tags(content: str, metadata: str = "", topic: str = "") -> str:
     if not content:
         return "No content provided for tag generation"
     
-    content_lower = content.lower()
+    now = datetime.now()  # One clock read serves both the recency check and the report timestamp
+    
+    tag_report = f"""
+Generated Tags
+{'=' * 20}
+Generation Timestamp: {now.isoformat(timespec='seconds')}
+Content Topic: {topic or 'General'}
+"""
+    
+    return tag_report + _tag_report_body(content, now.year)
+
+
+@_memoize_by_content
+def _tag_report_body(content: str, current_year: int) -> str:
+    """Build the tag sections of the tag report; depends only on content and the current year."""
+    # Only the keyword scan window needs lowercasing here
+    keyword_hits = _keyword_hits(content[:_KEYWORD_SCAN_LIMIT].lower())
     
     # Category-based tag generation
-    technology_tags = []
-    methodology_tags = []
     domain_tags = []
     difficulty_tags = []
     format_tags = []
     temporal_tags = []
     
-    # Technology tags
-    tech_indicators = {
-        'python': ['python', 'django', 'flask', 'pandas'],
-        'javascript': ['javascript', 'react', 'node', 'vue'],
-        'data-science': ['data science', 'machine learning', 'analytics', 'statistics'],
-        'web-development': ['html', 'css', 'frontend', 'backend', 'api'],
-        'cloud': ['aws', 'azure', 'cloud', 'kubernetes', 'docker'],
-        'ai': ['artificial intelligence', 'neural network', 'deep learning']
-    }
-    
-    for tech, indicators in tech_indicators.items():
-        if any(indicator in content_lower for indicator in indicators):
-            technology_tags.append(tech)
-    
-    # Methodology tags
-    method_indicators = {
-        'tutorial': ['tutorial', 'step-by-step', 'how-to', 'guide'],
-        'research': ['study', 'research', 'analysis', 'findings'],
-        'case-study': ['case study', 'example', 'implementation'],
-        'comparison': ['comparison', 'versus', 'vs', 'compare'],
-        'review': ['review', 'evaluation', 'assessment']
-    }
-    
-    for method, indicators in method_indicators.items():
-        if any(indicator in content_lower for indicator in indicators):
-            methodology_tags.append(method)
+    # Technology and methodology tags, collected from the labels of every matched keyword
+    matched_labels = {label for keyword in keyword_hits for label in _KEYWORD_TAGS.get(keyword, ())}
+    technology_tags = [tech for tech in _TECH_INDICATORS if ('technology', tech) in matched_labels]
+    methodology_tags = [method for method in _METHOD_INDICATORS if ('methodology', method) in matched_labels]
     
     # Difficulty assessment
-    if 'beginner' in content_lower or 'introduction' in content_lower:
+    if not _BEGINNER_DIFFICULTY.isdisjoint(keyword_hits):
         difficulty_tags.append('beginner-friendly')
-    elif 'advanced' in content_lower or 'expert' in content_lower:
+    elif not _ADVANCED_DIFFICULTY.isdisjoint(keyword_hits):
         difficulty_tags.append('advanced')
     else:
         difficulty_tags.append('intermediate')
     
     # Format tags based on content structure
-    if '```' in content or 'code' in content_lower:
+    if '```' in content or 'code' in keyword_hits:
         format_tags.append('code-examples')
-    if any(img_indicator in content_lower for img_indicator in ['image', 'figure', 'chart', 'graph']):
+    if not _IMAGE_INDICATORS.isdisjoint(keyword_hits):
         format_tags.append('visual-content')
     if len(content) > 2000:
         format_tags.append('long-form')
@@ -367,7 +535,6 @@ def generate_tags(content: str, metadata: str = "", topic: str = "") -> str:
         format_tags.append('concise')
     
     # Temporal tags
-    current_year = datetime.now().year
     if str(current_year) in content or str(current_year - 1) in content:
         temporal_tags.append('recent')
     
@@ -380,28 +547,22 @@ def generate_tags(content: str, metadata: str = "", topic: str = "") -> str:
         'Temporal': temporal_tags
     }
     
-    # Generate tag report
-    tag_report = f"""
-Generated Tags
-{'=' * 20}
-Generation Timestamp: {datetime.now().isoformat()}
-Content Topic: {topic or 'General'}
-
+    # Generate tag report (collected in a list and joined once)
+    report_parts = ["""
 Tag Categories:
-"""
+"""]
     
     for category, tags in all_tags.items():
         if tags:
-            tag_report += f"\n{category}:\n"
-            for tag in tags:
-                tag_report += f"  - {tag}\n"
+            report_parts.append(f"\n{category}:\n")
+            report_parts.extend(f"  - {tag}\n" for tag in tags)
     
     # Flat tag list for easy consumption
     flat_tags = []
     for tag_list in all_tags.values():
         flat_tags.extend(tag_list)
     
-    tag_report += f"""
+    report_parts.append(f"""
 Complete Tag Set:
 {', '.join(flat_tags)}
 
@@ -410,6 +571,6 @@ Tag Statistics:
 - Categories Used: {len([cat for cat, tags in all_tags.items() if tags])}
 - Technology Tags: {len(technology_tags)}
 - Methodology Tags: {len(methodology_tags)}
-"""
+{_keyword_scan_note(content)}""")
     
-    return tag_report
\ No newline at end of file
+    return "".join(report_parts)
\ No newline at end of file
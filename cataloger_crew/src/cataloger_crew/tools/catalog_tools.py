@@ -4,86 +4,339 @@ Catalog management and persistence tools for the cataloger crew.
 
 import json
 import csv
+import hashlib
+import io
 import os
+import shutil
+import threading
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
+from urllib.parse import urlsplit
 from crewai import tool
 
+try:
+    import orjson  # Native JSON codec: the whole catalog is parsed and encoded on every tool call
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes, compact unless indent is set, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_line(data: Any) -> bytes:
+    """Encode data as one compact JSON line for the append log."""
+    return _json_dumps(data) + b"\n"
+
+
+# Flags for appending to catalog.log; O_DSYNC where the platform has it (see append_entry)
+_O_DSYNC = getattr(os, 'O_DSYNC', 0)
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_DSYNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_durably(path: Path, data: bytes) -> None:
+    """Write data to path (replacing any previous contents) and fsync it before returning."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so renames and new names in it are durable (POSIX only)."""
+    if os.name != 'posix':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 class CatalogManager:
-    """Manages catalog data persistence and organization."""
+    """
+    Manages catalog data persistence and organization.
     
-    def __init__(self, catalog_dir: str = "catalog_data"):
+    New entries are appended to catalog.log, one JSON line each, rather than
+    rewriting the whole catalog; the log is folded into catalog.json once it
+    grows past log_compact_bytes. Both files hold compact JSON; use
+    pretty_dump() for a readable view.
+    """
+    
+    def __init__(self, catalog_dir: str = "catalog_data", log_compact_bytes: int = 10 * 1024 * 1024):
         self.catalog_dir = Path(catalog_dir)
         self.catalog_dir.mkdir(exist_ok=True)
         
         # Define file paths
         self.catalog_file = self.catalog_dir / "catalog.json"
+        self.log_file = self.catalog_dir / "catalog.log"
         self.backup_dir = self.catalog_dir / "backups"
         self.backup_dir.mkdir(exist_ok=True)
+        self.log_compact_bytes = log_compact_bytes
+        
+        # Backups are taken at most every backup_every_n_saves saves or backup_interval_seconds
+        self.backup_every_n_saves = 10
+        self.backup_interval_seconds = 3600
+        self._saves_since_backup = 0
+        self._last_backup_ts = float('-inf')
+        
+        # Search rounds run concurrently, so load/modify/save cycles must not interleave
+        self.lock = threading.RLock()
+        
+        # Parsed catalog kept in memory, keyed by the files' (mtime, size) when they were read
+        self._cache = None
+        self._cache_stamp = None
+        
+        # Inverted word index over titles and summaries, derived from the cached catalog
+        self._word_index_for = None
+        self._word_index = None
+    
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[tuple]:
+        """Return (mtime_ns, size) of a file, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _stamp(self) -> tuple:
+        """Stamp of the snapshot and the log together; either changing invalidates the cache."""
+        return (self._file_stamp(self.catalog_file), self._file_stamp(self.log_file))
     
     def load_catalog(self) -> Dict[str, Any]:
-        """Load existing catalog or create new one."""
-        if self.catalog_file.exists():
-            try:
-                with open(self.catalog_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+        """
+        Load existing catalog or create new one.
+        The parsed catalog is shared between calls and only re-read when the
+        files change on disk; callers that modify it must persist it afterwards.
+        Hold self.lock for as long as the returned catalog is used, since other
+        threads may be adding entries to the same dict.
+        """
+        with self.lock:
+            stamp = self._stamp()
+            if stamp == (None, None):
                 return self._create_empty_catalog()
-        else:
+            if self._cache is not None and stamp == self._cache_stamp:
+                return self._cache
+            catalog = self._read_snapshot()
+            self._replay_log(catalog)
+            self._cache = catalog
+            self._cache_stamp = stamp
+            return catalog
+    
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """Read catalog.json, falling back to an empty catalog if it is missing or unreadable."""
+        try:
+            catalog = _json_loads(self.catalog_file.read_bytes())
+        except (json.JSONDecodeError, IOError):
             return self._create_empty_catalog()
+        # Catalogs written before the URL index existed get it rebuilt once
+        if "url_index" not in catalog:
+            catalog["url_index"] = {
+                entry["url"]: entry_id
+                for entry_id, entry in catalog.get("entries", {}).items()
+                if entry.get("url")
+            }
+        # Rebuild the running statistics once for catalogs that predate them
+        if "quality_count" not in catalog.get("statistics", {}):
+            catalog["statistics"] = _empty_statistics()
+            for entry in catalog.get("entries", {}).values():
+                _update_statistics(catalog["statistics"], entry)
+        # Likewise for per-entry categories and the category index
+        if "categories_index" not in catalog:
+            categories_index = catalog["categories_index"] = {}
+            for entry_id, entry in catalog.get("entries", {}).items():
+                if "categories" not in entry:
+                    entry["categories"] = _get_entry_categories(entry)
+                for category in entry["categories"]:
+                    categories_index.setdefault(category, []).append(entry_id)
+        return catalog
+    
+    def _replay_log(self, catalog: Dict[str, Any]) -> None:
+        """Apply the entries appended since the last compaction."""
+        try:
+            lines = self.log_file.read_bytes().split(b"\n")
+        except IOError:
+            return
+        
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = _json_loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-append
+                continue
+            # Skip entries already compacted into the snapshot
+            if catalog["entries"].get(entry["id"]) == entry:
+                continue
+            catalog["entries"][entry["id"]] = entry
+            _update_catalog_indices(catalog, entry)
+            catalog["metadata"]["last_updated"] = entry.get("last_updated", catalog["metadata"]["last_updated"])
+        catalog["metadata"]["total_entries"] = len(catalog["entries"])
+    
+    def append_entry(self, catalog_data: Dict[str, Any], entry: Dict[str, Any],
+                     now_iso: Optional[str] = None) -> bool:
+        """
+        Persist a new entry already added to catalog_data by appending it to the log.
+        Compacts into catalog.json when the log passes log_compact_bytes.
+        now_iso lets the caller reuse the timestamp it already stamped the entry with.
+        """
+        try:
+            now_iso = now_iso or datetime.now().isoformat()
+            catalog_data["metadata"]["last_updated"] = now_iso
+            catalog_data["metadata"]["total_entries"] = len(catalog_data.get("entries", {}))
+            
+            # O_DSYNC makes each append durable as part of the write itself, without a separate fsync
+            fd = os.open(self.log_file, _LOG_OPEN_FLAGS, 0o644)
+            try:
+                os.write(fd, _json_line(entry))
+                if not _O_DSYNC:
+                    os.fsync(fd)
+                log_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            
+            if log_size > self.log_compact_bytes:
+                return self.save_catalog(catalog_data, now_iso)
+            
+            self._cache = catalog_data
+            self._cache_stamp = self._stamp()
+            return True
+        except Exception as e:
+            print(f"Error appending catalog entry: {e}")
+            self._cache = None
+            return False
+    
+    def word_index(self, catalog: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the inverted word index for a loaded catalog.
+        Maps each lowercased title/summary word to the IDs of the entries containing it,
+        and each entry ID to its position in the catalog and its (title, summary) word
+        sets. Built on first use and then extended with entries added since, so it is
+        never persisted.
+        """
+        with self.lock:
+            if self._word_index_for is not catalog:
+                self._word_index_for = catalog
+                self._word_index = {"title": {}, "summary": {}, "position": {}, "words": {}}
+            index = self._word_index
+            positions = index["position"]
+            entries = catalog["entries"]
+            for position, (entry_id, entry) in enumerate(
+                islice(entries.items(), len(positions), None), start=len(positions)
+            ):
+                positions[entry_id] = position
+                word_sets = (_word_set(entry.get("title")), _word_set(entry.get("summary")))
+                index["words"][entry_id] = word_sets
+                for field, words in zip(("title", "summary"), word_sets):
+                    field_index = index[field]
+                    for word in words:
+                        field_index.setdefault(word, set()).add(entry_id)
+            return index
+    
+    def pretty_dump(self) -> str:
+        """Return the current catalog, including entries still in the log, as indented JSON for reading."""
+        with self.lock:
+            return _json_dumps(self.load_catalog(), indent=True).decode('utf-8')
     
     def _create_empty_catalog(self) -> Dict[str, Any]:
         """Create empty catalog structure."""
+        now_iso = datetime.now().isoformat()
         return {
             "metadata": {
-                "created": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "created": now_iso,
+                "last_updated": now_iso,
                 "version": "1.0",
                 "total_entries": 0
             },
             "entries": {},
+            "url_index": {},
             "categories": {},
+            "categories_index": {},
             "tags": {},
-            "statistics": {
-                "content_types": {},
-                "sources": {},
-                "quality_distribution": {}
-            }
+            "statistics": _empty_statistics()
         }
     
-    def save_catalog(self, catalog_data: Dict[str, Any]) -> bool:
-        """Save catalog data to file."""
+    def save_catalog(self, catalog_data: Dict[str, Any], now_iso: Optional[str] = None) -> bool:
+        """Save the full catalog to catalog.json and clear the append log."""
         try:
             # Update metadata
-            catalog_data["metadata"]["last_updated"] = datetime.now().isoformat()
+            catalog_data["metadata"]["last_updated"] = now_iso or datetime.now().isoformat()
             catalog_data["metadata"]["total_entries"] = len(catalog_data.get("entries", {}))
             
             # Create backup before saving
             self._create_backup()
             
-            # Save main catalog
-            with open(self.catalog_file, 'w', encoding='utf-8') as f:
-                json.dump(catalog_data, f, indent=2, ensure_ascii=False)
+            # Save main catalog to a new file and swap it in, so a backup
+            # hard-linked to the previous version keeps its contents.
+            # The data and the rename are both synced before the log goes away;
+            # otherwise a crash could leave an empty snapshot and no log to replay.
+            tmp_file = self.catalog_file.with_suffix('.json.tmp')
+            _write_durably(tmp_file, _json_dumps(catalog_data))
+            os.replace(tmp_file, self.catalog_file)
+            _fsync_dir(self.catalog_dir)
             
+            # Everything in the log is now durably part of the snapshot
+            self.log_file.unlink(missing_ok=True)
+            
+            # What was just written is what the next load would parse
+            self._cache = catalog_data
+            self._cache_stamp = self._stamp()
             return True
         except Exception as e:
             print(f"Error saving catalog: {e}")
+            # The in-memory copy may hold unsaved changes; re-read from disk next time
+            self._cache = None
             return False
     
     def _create_backup(self) -> None:
-        """Create backup of current catalog."""
+        """Create backup of current catalog, at most once per batch of saves."""
+        self._saves_since_backup += 1
+        if (self._saves_since_backup < self.backup_every_n_saves
+                and time.monotonic() - self._last_backup_ts < self.backup_interval_seconds):
+            return
+        
         if self.catalog_file.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = self.backup_dir / f"catalog_backup_{timestamp}.json"
             
             try:
-                with open(self.catalog_file, 'r', encoding='utf-8') as src:
-                    with open(backup_file, 'w', encoding='utf-8') as dst:
-                        dst.write(src.read())
+                try:
+                    # Saves replace catalog.json rather than rewrite it, so a hard link is a safe snapshot
+                    os.link(self.catalog_file, backup_file)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    # Filesystems without hard links
+                    shutil.copyfile(self.catalog_file, backup_file)
             except Exception as e:
                 print(f"Error creating backup: {e}")
+                return
+        
+        self._saves_since_backup = 0
+        self._last_backup_ts = time.monotonic()
 
 
 # Global catalog manager instance
@@ -114,51 +367,58 @@ def create_catalog_entry(
         Entry creation status and details
     """
     try:
-        # Load current catalog
-        catalog = catalog_manager.load_catalog()
-        
-        # Parse tags
-        tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-        
-        # Parse metadata
-        try:
-            meta_dict = json.loads(metadata) if metadata else {}
-        except json.JSONDecodeError:
-            meta_dict = {"raw_metadata": metadata}
-        
-        # Generate unique entry ID
-        entry_id = f"entry_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(url) % 10000}"
-        
-        # Check for duplicates
-        for existing_id, existing_entry in catalog["entries"].items():
-            if existing_entry.get("url") == url:
+        with catalog_manager.lock:
+            # Load current catalog
+            catalog = catalog_manager.load_catalog()
+            
+            # Parse tags
+            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+            
+            # Parse metadata; only a JSON object carries content_type/technical_level
+            try:
+                meta_dict = _json_loads(metadata) if metadata else {}
+            except json.JSONDecodeError:
+                meta_dict = None
+            if not isinstance(meta_dict, dict):
+                meta_dict = {"raw_metadata": metadata}
+            
+            # One timestamp for the ID, the entry and the catalog metadata
+            now = datetime.now()
+            now_iso = now.isoformat()
+            
+            # Generate unique entry ID; the URL digest is stable across processes, unlike hash()
+            entry_id = f"entry_{now.strftime('%Y%m%d_%H%M%S')}_{_url_digest(url)}"
+            
+            # Check for duplicates
+            existing_id = catalog["url_index"].get(url)
+            if existing_id is not None:
                 return f"Duplicate entry detected: URL already exists in catalog as {existing_id}"
-        
-        # Create entry
-        entry = {
-            "id": entry_id,
-            "title": title,
-            "url": url,
-            "summary": content_summary,
-            "tags": tag_list,
-            "metadata": meta_dict,
-            "quality_score": quality_score,
-            "created": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "source_domain": _extract_domain(url),
-            "content_type": meta_dict.get("content_type", "unknown"),
-            "technical_level": meta_dict.get("technical_level", "unknown")
-        }
-        
-        # Add to catalog
-        catalog["entries"][entry_id] = entry
-        
-        # Update categories and tags
-        _update_catalog_indices(catalog, entry)
-        
-        # Save catalog
-        if catalog_manager.save_catalog(catalog):
-            return f"""
+            
+            # Create entry
+            entry = {
+                "id": entry_id,
+                "title": title,
+                "url": url,
+                "summary": content_summary,
+                "tags": tag_list,
+                "metadata": meta_dict,
+                "quality_score": quality_score,
+                "created": now_iso,
+                "last_updated": now_iso,
+                "source_domain": _extract_domain(url),
+                "content_type": meta_dict.get("content_type", "unknown"),
+                "technical_level": meta_dict.get("technical_level", "unknown")
+            }
+            
+            # Add to catalog
+            catalog["entries"][entry_id] = entry
+            
+            # Update categories and tags
+            _update_catalog_indices(catalog, entry)
+            
+            # Save catalog
+            if catalog_manager.append_entry(catalog, entry, now_iso):
+                return f"""
 Entry Created Successfully
 {'=' * 30}
 Entry ID: {entry_id}
@@ -170,26 +430,41 @@ Created: {entry["created"]}
 
 Catalog Statistics:
 - Total Entries: {len(catalog["entries"])}
-- This Entry's Categories: {_get_entry_categories(entry)}
+- This Entry's Categories: {entry["categories"]}
 """
-        else:
-            return "Error: Failed to save catalog entry"
+            else:
+                return "Error: Failed to save catalog entry"
             
     except Exception as e:
         return f"Error creating catalog entry: {str(e)}"
 
 
+def _url_digest(url: str) -> str:
+    """Short stable hex digest of a URL for entry IDs."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=4).hexdigest()
+
+
 def _extract_domain(url: str) -> str:
     """Extract domain from URL."""
     try:
-        from urllib.parse import urlparse
-        return urlparse(url).netloc
-    except:
+        # urlsplit skips urlparse's ;params handling, which netloc never needs
+        return urlsplit(url).netloc
+    except ValueError:
         return "unknown"
 
 
 def _update_catalog_indices(catalog: Dict[str, Any], entry: Dict[str, Any]) -> None:
-    """Update catalog indices for categories and tags."""
+    """Update catalog indices for URLs, categories and tags."""
+    catalog["url_index"][entry["url"]] = entry["id"]
+    
+    # Categories are derived from fields that never change, so they are computed once
+    if "categories" not in entry:
+        entry["categories"] = _get_entry_categories(entry)
+    for category in entry["categories"]:
+        if category not in catalog["categories_index"]:
+            catalog["categories_index"][category] = []
+        catalog["categories_index"][category].append(entry["id"])
+    
     # Update tag index
     for tag in entry["tags"]:
         if tag not in catalog["tags"]:
@@ -203,24 +478,48 @@ def _update_catalog_indices(catalog: Dict[str, Any], entry: Dict[str, Any]) -> N
     catalog["categories"][content_type].append(entry["id"])
     
     # Update statistics
-    stats = catalog["statistics"]
-    
-    # Content types
-    if content_type not in stats["content_types"]:
-        stats["content_types"][content_type] = 0
-    stats["content_types"][content_type] += 1
+    _update_statistics(catalog["statistics"], entry)
+
+
+def _empty_statistics() -> Dict[str, Any]:
+    """Create the running statistics block kept in catalog["statistics"]."""
+    return {
+        "content_types": {},
+        "sources": {},
+        "quality_distribution": {},
+        "technical_levels": {},
+        "tags": {},
+        "quality_count": 0,
+        "quality_sum": 0.0,
+        "quality_min": None,
+        "quality_max": None
+    }
+
+
+def _update_statistics(stats: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """Fold one entry into the running statistics, so reports never rescan the catalog."""
+    for key, value in (
+        ("content_types", entry.get("content_type", "unknown")),
+        ("sources", entry.get("source_domain", "unknown")),
+        ("technical_levels", entry.get("technical_level", "unknown")),
+    ):
+        counts = stats[key]
+        counts[value] = counts.get(value, 0) + 1
     
-    # Sources
-    domain = entry["source_domain"]
-    if domain not in stats["sources"]:
-        stats["sources"][domain] = 0
-    stats["sources"][domain] += 1
+    tag_counts = stats["tags"]
+    for tag in entry.get("tags", ()):
+        tag_counts[tag] = tag_counts.get(tag, 0) + 1
     
-    # Quality distribution
-    quality_range = _get_quality_range(entry["quality_score"])
-    if quality_range not in stats["quality_distribution"]:
-        stats["quality_distribution"][quality_range] = 0
-    stats["quality_distribution"][quality_range] += 1
+    if "quality_score" in entry:
+        score = entry["quality_score"]
+        quality_range = _get_quality_range(score)
+        stats["quality_distribution"][quality_range] = stats["quality_distribution"].get(quality_range, 0) + 1
+        stats["quality_count"] += 1
+        stats["quality_sum"] += score
+        if stats["quality_min"] is None or score < stats["quality_min"]:
+            stats["quality_min"] = score
+        if stats["quality_max"] is None or score > stats["quality_max"]:
+            stats["quality_max"] = score
 
 
 def _get_entry_categories(entry: Dict[str, Any]) -> List[str]:
@@ -271,44 +570,64 @@ def detect_duplicates(url: str, title: str = "", content_summary: str = "") -> s
         Duplicate detection report
     """
     try:
-        catalog = catalog_manager.load_catalog()
-        duplicates = []
-        
-        for entry_id, entry in catalog["entries"].items():
-            similarity_score = 0
-            reasons = []
-            
-            # Check URL match (exact)
-            if entry.get("url") == url:
-                similarity_score += 100
-                reasons.append("Exact URL match")
-            
-            # Check title similarity (simple word overlap)
-            if title and entry.get("title"):
-                title_similarity = _calculate_text_similarity(title, entry["title"])
-                if title_similarity > 0.8:
-                    similarity_score += 50
-                    reasons.append(f"Title similarity: {title_similarity:.2f}")
-            
-            # Check content summary similarity
-            if content_summary and entry.get("summary"):
-                content_similarity = _calculate_text_similarity(content_summary, entry["summary"])
-                if content_similarity > 0.7:
-                    similarity_score += 30
-                    reasons.append(f"Content similarity: {content_similarity:.2f}")
-            
-            # If high similarity, flag as potential duplicate
-            if similarity_score >= 60:
-                duplicates.append({
-                    "entry_id": entry_id,
-                    "similarity_score": similarity_score,
-                    "reasons": reasons,
-                    "existing_title": entry.get("title", ""),
-                    "existing_url": entry.get("url", "")
-                })
-        
-        if duplicates:
-            report = f"""
+        # The catalog is shared with concurrent writers; hold the lock while reading it
+        with catalog_manager.lock:
+            catalog = catalog_manager.load_catalog()
+            duplicates = []
+            
+            # Without a URL match, flagging needs both title (50) and summary (30) similarity,
+            # so only entries sharing at least one title word and one summary word can qualify
+            index = catalog_manager.word_index(catalog)
+            title_words = _word_set(title)
+            summary_words = _word_set(content_summary)
+            candidates = set()
+            if title_words and summary_words:
+                title_hits = _entries_sharing_words(index["title"], title_words)
+                if title_hits:
+                    candidates = title_hits & _entries_sharing_words(index["summary"], summary_words)
+            url_match = catalog["url_index"].get(url)
+            if url_match is not None:
+                candidates.add(url_match)
+            candidates = sorted(candidates, key=index["position"].__getitem__)
+            
+            for entry_id in candidates:
+                entry = catalog["entries"][entry_id]
+                entry_title_words, entry_summary_words = index["words"][entry_id]
+                similarity_score = 0
+                reasons = []
+                
+                # Check URL match (exact)
+                if entry.get("url") == url:
+                    similarity_score += 100
+                    reasons.append("Exact URL match")
+                
+                # Check title similarity (simple word overlap)
+                if title and entry.get("title") and _sizes_allow_similarity(title_words, entry_title_words, 0.8):
+                    title_similarity = _word_set_similarity(title_words, entry_title_words)
+                    if title_similarity > 0.8:
+                        similarity_score += 50
+                        reasons.append(f"Title similarity: {title_similarity:.2f}")
+                
+                # Check content summary similarity
+                if (content_summary and entry.get("summary")
+                        and _sizes_allow_similarity(summary_words, entry_summary_words, 0.7)):
+                    content_similarity = _word_set_similarity(summary_words, entry_summary_words)
+                    if content_similarity > 0.7:
+                        similarity_score += 30
+                        reasons.append(f"Content similarity: {content_similarity:.2f}")
+                
+                # If high similarity, flag as potential duplicate
+                if similarity_score >= 60:
+                    duplicates.append({
+                        "entry_id": entry_id,
+                        "similarity_score": similarity_score,
+                        "reasons": reasons,
+                        "existing_title": entry.get("title", ""),
+                        "existing_url": entry.get("url", "")
+                    })
+            
+            if duplicates:
+                report = f"""
 Potential Duplicates Detected
 {'=' * 35}
 Checking: {title or 'No title provided'}
@@ -316,16 +635,16 @@ URL: {url}
 
 Found {len(duplicates)} potential duplicate(s):
 """
-            for i, dup in enumerate(duplicates, 1):
-                report += f"""
+                for i, dup in enumerate(duplicates, 1):
+                    report += f"""
 {i}. Entry ID: {dup['entry_id']}
    Similarity Score: {dup['similarity_score']}%
    Existing Title: {dup['existing_title']}
    Existing URL: {dup['existing_url']}
    Reasons: {', '.join(dup['reasons'])}
 """
-        else:
-            report = f"""
+            else:
+                report = f"""
 No Duplicates Detected
 {'=' * 25}
 Checking: {title or 'No title provided'}
@@ -333,28 +652,123 @@ URL: {url}
 
 The content appears to be unique in the catalog.
 """
-        
-        return report
-        
+            
+            return report
+            
     except Exception as e:
         return f"Error detecting duplicates: {str(e)}"
 
 
-def _calculate_text_similarity(text1: str, text2: str) -> float:
-    """Calculate simple text similarity based on word overlap."""
-    if not text1 or not text2:
+def _word_set(text: Optional[str]) -> frozenset:
+    """Lowercased words of a text, as compared by the duplicate detector."""
+    return frozenset(text.lower().split()) if text else frozenset()
+
+
+def _entries_sharing_words(field_index: Dict[str, set], words: frozenset) -> set:
+    """IDs of entries whose indexed field shares at least one of the given words."""
+    hits = set()
+    for word in words:
+        hits.update(field_index.get(word, ()))
+    return hits
+
+
+def _sizes_allow_similarity(words1: frozenset, words2: frozenset, threshold: float) -> bool:
+    """
+    Cheap prefilter: Jaccard similarity can be at most min(|a|, |b|) / max(|a|, |b|),
+    so pairs whose size ratio is not above threshold can be skipped without intersecting.
+    """
+    len1, len2 = len(words1), len(words2)
+    if len1 > len2:
+        len1, len2 = len2, len1
+    return len2 > 0 and len1 / len2 > threshold
+
+
+def _word_set_similarity(words1: frozenset, words2: frozenset) -> float:
+    """Jaccard similarity of two word sets; the union size is derived rather than built."""
+    if not words1 or not words2:
         return 0.0
     
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
+
+
+def _calculate_text_similarity(text1: str, text2: str) -> float:
+    """Calculate simple text similarity based on word overlap."""
+    return _word_set_similarity(_word_set(text1), _word_set(text2))
+
+
+# Entries rendered per write when exporting; bounds memory for large catalogs
+_EXPORT_CHUNK_ENTRIES = 500
+
+
+def _json_export_chunks(metadata: Dict[str, Any], entries_to_export: Dict[str, Any],
+                        export_info: Dict[str, Any]):
+    """
+    Yield the indented JSON export as byte chunks, encoding entries a batch at a time
+    instead of the whole document at once. Output matches a single indented dump of
+    {"metadata", "entries", "export_info"}.
+    """
+    def nested(data: Any, depth: int) -> bytes:
+        # JSON text never contains raw newlines, so re-indenting by line is safe
+        return _json_dumps(data, indent=True).replace(b"\n", b"\n" + b"  " * depth)
     
-    if not words1 or not words2:
-        return 0.0
+    yield b'{\n  "metadata": ' + nested(metadata, 1) + b',\n  "entries": '
+    if not entries_to_export:
+        yield b"{}"
+    else:
+        separator = b"{\n"
+        parts = []
+        for entry_id, entry in entries_to_export.items():
+            parts.append(b"    " + _json_dumps(entry_id) + b": " + nested(entry, 2))
+            if len(parts) >= _EXPORT_CHUNK_ENTRIES:
+                yield separator + b",\n".join(parts)
+                separator = b",\n"
+                parts = []
+        if parts:
+            yield separator + b",\n".join(parts)
+        yield b"\n  }"
+    yield b',\n  "export_info": ' + nested(export_info, 1) + b"\n}"
+
+
+def _markdown_export_chunks(entries_to_export: Dict[str, Any], filter_category: str = "",
+                            generated: Optional[str] = None):
+    """Yield the markdown export as text chunks of up to _EXPORT_CHUNK_ENTRIES entries each."""
+    header = (
+        "# Catalog Export\n\n"
+        f"**Generated:** {generated or datetime.now().isoformat()}\n"
+        f"**Total Entries:** {len(entries_to_export)}\n"
+    )
+    if filter_category:
+        header += f"**Filter Applied:** {filter_category}\n"
+    yield header + "\n---\n\n"
     
-    intersection = words1.intersection(words2)
-    union = words1.union(words2)
+    # Group by content type
+    by_type = {}
+    for entry_id, entry in entries_to_export.items():
+        content_type = entry.get('content_type', 'unknown')
+        if content_type not in by_type:
+            by_type[content_type] = []
+        by_type[content_type].append((entry_id, entry))
     
-    return len(intersection) / len(union) if union else 0.0
+    parts = []
+    for content_type, entries in by_type.items():
+        parts.append(f"## {content_type.title().replace('_', ' ')}\n\n")
+        
+        for entry_id, entry in entries:
+            parts.append(
+                f"### {entry.get('title', 'Untitled')}\n\n"
+                f"**URL:** {entry.get('url', '')}\n\n"
+                f"**Summary:** {entry.get('summary', '')}\n\n"
+                f"**Tags:** {', '.join(entry.get('tags', []))}\n\n"
+                f"**Quality Score:** {entry.get('quality_score', 'N/A')}/10\n\n"
+                f"**Technical Level:** {entry.get('technical_level', 'N/A')}\n\n"
+                f"---\n\n"
+            )
+            if len(parts) >= _EXPORT_CHUNK_ENTRIES:
+                yield "".join(parts)
+                parts = []
+    if parts:
+        yield "".join(parts)
 
 
 @tool("Catalog Exporter")
@@ -370,37 +784,38 @@ def export_catalog(format_type: str = "json", filter_category: str = "") -> str:
         Export status and file information
     """
     try:
-        catalog = catalog_manager.load_catalog()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Filter entries if category specified
-        entries_to_export = catalog["entries"]
-        if filter_category:
-            entries_to_export = {
-                entry_id: entry for entry_id, entry in catalog["entries"].items()
-                if filter_category in _get_entry_categories(entry)
-            }
-        
-        if format_type.lower() == "json":
-            export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.json"
-            export_data = {
-                "metadata": catalog["metadata"],
-                "entries": entries_to_export,
-                "export_info": {
-                    "exported_at": datetime.now().isoformat(),
+        # The catalog is shared with concurrent writers; hold the lock until the export is written
+        with catalog_manager.lock:
+            catalog = catalog_manager.load_catalog()
+            now = datetime.now()
+            now_iso = now.isoformat()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            
+            # Filter entries if category specified
+            entries_to_export = catalog["entries"]
+            if filter_category:
+                entries_to_export = {
+                    entry_id: catalog["entries"][entry_id]
+                    for entry_id in catalog["categories_index"].get(filter_category, ())
+                }
+            
+            if format_type.lower() == "json":
+                export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.json"
+                export_info = {
+                    "exported_at": now_iso,
                     "filter_applied": filter_category or "none",
                     "total_entries": len(entries_to_export)
                 }
-            }
-            
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
-        
-        elif format_type.lower() == "csv":
-            export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.csv"
+                
+                with open(export_file, 'wb') as f:
+                    f.writelines(_json_export_chunks(catalog["metadata"], entries_to_export, export_info))
             
-            with open(export_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            elif format_type.lower() == "csv":
+                export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.csv"
+                
+                # Rows are rendered into memory and written to the file in one call
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
                 
                 # Write header
                 writer.writerow([
@@ -409,8 +824,8 @@ def export_catalog(format_type: str = "json", filter_category: str = "") -> str:
                 ])
                 
                 # Write entries
-                for entry_id, entry in entries_to_export.items():
-                    writer.writerow([
+                writer.writerows(
+                    (
                         entry_id,
                         entry.get('title', ''),
                         entry.get('url', ''),
@@ -421,43 +836,22 @@ def export_catalog(format_type: str = "json", filter_category: str = "") -> str:
                         entry.get('quality_score', ''),
                         entry.get('source_domain', ''),
                         entry.get('created', '')
-                    ])
-        
-        elif format_type.lower() == "markdown":
-            export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.md"
-            
-            with open(export_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Catalog Export\n\n")
-                f.write(f"**Generated:** {datetime.now().isoformat()}\n")
-                f.write(f"**Total Entries:** {len(entries_to_export)}\n")
-                if filter_category:
-                    f.write(f"**Filter Applied:** {filter_category}\n")
-                f.write(f"\n---\n\n")
+                    )
+                    for entry_id, entry in entries_to_export.items()
+                )
                 
-                # Group by content type
-                by_type = {}
-                for entry_id, entry in entries_to_export.items():
-                    content_type = entry.get('content_type', 'unknown')
-                    if content_type not in by_type:
-                        by_type[content_type] = []
-                    by_type[content_type].append((entry_id, entry))
+                export_file.write_bytes(buffer.getvalue().encode('utf-8'))
+            
+            elif format_type.lower() == "markdown":
+                export_file = catalog_manager.catalog_dir / f"catalog_export_{timestamp}.md"
                 
-                for content_type, entries in by_type.items():
-                    f.write(f"## {content_type.title().replace('_', ' ')}\n\n")
-                    
-                    for entry_id, entry in entries:
-                        f.write(f"### {entry.get('title', 'Untitled')}\n\n")
-                        f.write(f"**URL:** {entry.get('url', '')}\n\n")
-                        f.write(f"**Summary:** {entry.get('summary', '')}\n\n")
-                        f.write(f"**Tags:** {', '.join(entry.get('tags', []))}\n\n")
-                        f.write(f"**Quality Score:** {entry.get('quality_score', 'N/A')}/10\n\n")
-                        f.write(f"**Technical Level:** {entry.get('technical_level', 'N/A')}\n\n")
-                        f.write(f"---\n\n")
-        
-        else:
-            return f"Error: Unsupported export format '{format_type}'. Use 'json', 'csv', or 'markdown'."
-        
-        return f"""
+                with open(export_file, 'w', encoding='utf-8') as f:
+                    f.writelines(_markdown_export_chunks(entries_to_export, filter_category, now_iso))
+            
+            else:
+                return f"Error: Unsupported export format '{format_type}'. Use 'json', 'csv', or 'markdown'."
+            
+            return f"""
 Catalog Export Completed
 {'=' * 30}
 Format: {format_type.upper()}
@@ -465,11 +859,11 @@ File: {export_file.name}
 Location: {export_file}
 Entries Exported: {len(entries_to_export)}
 Filter Applied: {filter_category or 'None'}
-Export Time: {datetime.now().isoformat()}
+Export Time: {now_iso}
 
 File Size: {export_file.stat().st_size if export_file.exists() else 0} bytes
 """
-        
+            
     except Exception as e:
         return f"Error exporting catalog: {str(e)}"
 
@@ -483,64 +877,37 @@ def generate_catalog_statistics() -> str:
         Detailed statistics report
     """
     try:
-        catalog = catalog_manager.load_catalog()
-        entries = catalog.get("entries", {})
-        
-        if not entries:
-            return "Catalog is empty - no statistics available."
-        
-        # Basic counts
-        total_entries = len(entries)
-        
-        # Content type distribution
-        content_types = {}
-        quality_scores = []
-        technical_levels = {}
-        source_domains = {}
-        creation_dates = []
-        
-        for entry in entries.values():
-            # Content types
-            content_type = entry.get("content_type", "unknown")
-            content_types[content_type] = content_types.get(content_type, 0) + 1
-            
-            # Quality scores
-            if "quality_score" in entry:
-                quality_scores.append(entry["quality_score"])
-            
-            # Technical levels
-            tech_level = entry.get("technical_level", "unknown")
-            technical_levels[tech_level] = technical_levels.get(tech_level, 0) + 1
-            
-            # Source domains
-            domain = entry.get("source_domain", "unknown")
-            source_domains[domain] = source_domains.get(domain, 0) + 1
-            
-            # Creation dates
-            if "created" in entry:
-                creation_dates.append(entry["created"])
-        
-        # Calculate quality statistics
-        if quality_scores:
-            avg_quality = sum(quality_scores) / len(quality_scores)
-            max_quality = max(quality_scores)
-            min_quality = min(quality_scores)
-        else:
-            avg_quality = max_quality = min_quality = 0
-        
-        # Tag statistics
-        all_tags = []
-        for entry in entries.values():
-            all_tags.extend(entry.get("tags", []))
-        
-        tag_counts = {}
-        for tag in all_tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        # Generate report
-        stats_report = f"""
+        # The catalog is shared with concurrent writers; hold the lock while reading it
+        with catalog_manager.lock:
+            catalog = catalog_manager.load_catalog()
+            entries = catalog.get("entries", {})
+            
+            if not entries:
+                return "Catalog is empty - no statistics available."
+            
+            # Basic counts
+            total_entries = len(entries)
+            
+            # Distributions are maintained on insert by _update_statistics
+            stats = catalog["statistics"]
+            content_types = Counter(stats["content_types"])
+            technical_levels = Counter(stats["technical_levels"])
+            source_domains = Counter(stats["sources"])
+            tag_counts = Counter(stats["tags"])
+            quality_count = stats["quality_count"]
+            
+            # Calculate quality statistics
+            if quality_count:
+                avg_quality = stats["quality_sum"] / quality_count
+                max_quality = stats["quality_max"]
+                min_quality = stats["quality_min"]
+            else:
+                avg_quality = max_quality = min_quality = 0
+            
+            top_tags = tag_counts.most_common(10)
+            
+            # Generate report
+            stats_report = f"""
 Catalog Statistics Report
 {'=' * 35}
 Generated: {datetime.now().isoformat()}
@@ -557,39 +924,39 @@ Quality Metrics:
 - Average Quality Score: {avg_quality:.2f}/10
 - Highest Quality Score: {max_quality}/10
 - Lowest Quality Score: {min_quality}/10
-- Entries with Quality Scores: {len(quality_scores)}/{total_entries}
+- Entries with Quality Scores: {quality_count}/{total_entries}
 
 Content Type Distribution:
 """
-        
-        for content_type, count in sorted(content_types.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_entries) * 100
-            stats_report += f"- {content_type}: {count} ({percentage:.1f}%)\n"
-        
-        stats_report += f"""
+            
+            for content_type, count in content_types.most_common():
+                percentage = (count / total_entries) * 100
+                stats_report += f"- {content_type}: {count} ({percentage:.1f}%)\n"
+            
+            stats_report += f"""
 Technical Level Distribution:
 """
-        
-        for level, count in sorted(technical_levels.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_entries) * 100
-            stats_report += f"- {level}: {count} ({percentage:.1f}%)\n"
-        
-        stats_report += f"""
+            
+            for level, count in technical_levels.most_common():
+                percentage = (count / total_entries) * 100
+                stats_report += f"- {level}: {count} ({percentage:.1f}%)\n"
+            
+            stats_report += f"""
 Top Source Domains:
 """
-        
-        for domain, count in sorted(source_domains.items(), key=lambda x: x[1], reverse=True)[:10]:
-            percentage = (count / total_entries) * 100
-            stats_report += f"- {domain}: {count} ({percentage:.1f}%)\n"
-        
-        stats_report += f"""
+            
+            for domain, count in source_domains.most_common(10):
+                percentage = (count / total_entries) * 100
+                stats_report += f"- {domain}: {count} ({percentage:.1f}%)\n"
+            
+            stats_report += f"""
 Most Popular Tags:
 """
-        
-        for tag, count in top_tags:
-            stats_report += f"- {tag}: {count} entries\n"
-        
-        return stats_report
-        
+            
+            for tag, count in top_tags:
+                stats_report += f"- {tag}: {count} entries\n"
+            
+            return stats_report
+            
     except Exception as e:
         return f"Error generating statistics: {str(e)}"
\ No newline at end of file
@@ -5,18 +5,144 @@ Enhanced search tools for the cataloger crew with autonomous search capabilities
 import os
 import json
 import time
+import hashlib
+import sqlite3
+import threading
+import functools
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from crewai_tools import SerperDevTool
 from crewai import tool
 
 
+class SearchResultCache:
+    """
+    Persistent SQLite-backed cache of Serper responses with a time-to-live.
+    Autonomous sessions repeat the same seed queries every interval; cached
+    responses are served from disk instead of calling the Serper API again.
+    """
+    
+    def __init__(self, path, ttl_seconds: int = 86400):
+        self.path = Path(path).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS serper_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, expires FROM serper_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Error reading search cache: {e}")
+                return None
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key until the TTL expires."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO serper_cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + self.ttl_seconds),
+                )
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Error writing search cache: {e}")
+    
+    @staticmethod
+    def make_key(query: str, *parts: Any) -> str:
+        """Build a cache key from a normalized query plus any extra request parameters."""
+        normalized = " ".join(str(query).lower().split())
+        raw = "|".join([normalized, *map(str, parts)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# Shared cache; location and lifetime can be overridden through the environment
+search_result_cache = SearchResultCache(
+    os.getenv("SERPER_CACHE_PATH", "catalog_data/serper_cache.sqlite3"),
+    ttl_seconds=int(os.getenv("SERPER_CACHE_TTL", "86400"))
+)
+
+
+SERPER_BASE_URL = "https://google.serper.dev"
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Return the shared keep-alive session so searches reuse pooled TLS connections."""
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"})  # Serper searches are idempotent POSTs
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers.update({"content-type": "application/json"})
+    return session
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool that serves repeated queries from the persistent search cache."""
+    
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        key = SearchResultCache.make_key(search_query, search_type, self.n_results)
+        results = search_result_cache.get(key)
+        if results is None:
+            results = self._pooled_request(search_query, search_type)
+            search_result_cache.set(key, results)
+        return results
+    
+    def _pooled_request(self, search_query: str, search_type: str) -> Dict[str, Any]:
+        """Call the Serper API through the shared pooled session."""
+        payload = {"q": search_query, "num": self.n_results}
+        for field, param in (("country", "gl"), ("location", "location"), ("locale", "hl")):
+            value = getattr(self, field, "")
+            if value:
+                payload[param] = value
+        response = get_http_session().post(
+            f"{SERPER_BASE_URL}/{search_type}",
+            headers={"X-API-KEY": os.environ["SERPER_API_KEY"]},
+            json=payload,
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+@functools.lru_cache(maxsize=1)
+def get_serper_tool() -> SerperDevTool:
+    """Return the shared search tool instance, creating it on first use."""
+    return CachedSerperDevTool()
+
+
 class AutonomousSearchTool:
     """Enhanced search tool with autonomous capabilities for the cataloger crew."""
     
     def __init__(self):
         try:
-            self.web_search_tool = SerperDevTool()
+            self.web_search_tool = get_serper_tool()
             self.search_history = []
         except Exception as e:
             print(f"Error initializing search tool: {e}")
@@ -41,8 +167,8 @@ def enhanced_web_search(query: str, search_type: str = "web", num_results: int =
         Formatted search results with metadata
     """
     try:
-        # Initialize search tool
-        search_tool = SerperDevTool()
+        # Reuse the shared search tool
+        search_tool = get_serper_tool()
         
         # Perform search
         results = search_tool.run(query)
@@ -61,7 +187,7 @@ Search Metadata:
 - Search Type: {search_type}
 - Requested Results: {num_results}
 - Execution Time: {datetime.now().isoformat()}
-- Query Hash: {hash(query)}
+- Query Hash: {hashlib.blake2b(query.encode('utf-8'), digest_size=8).hexdigest()}
 """
         
         return formatted_results
@@ -70,88 +196,31 @@ Search Metadata:
         return f"Search failed: {str(e)}"
 
 
-@tool("Query Evolution Tool")
-def evolve_search_queries(previous_results: str, topic: str, round_number: int = 1) -> str:
-    """
-    Generate evolved search queries based on previous results and topic.
-    
-    Args:
-        previous_results: Results from previous search rounds
-        topic: Main topic being researched
-        round_number: Current search round number
-    
-    Returns:
-        List of evolved search queries with reasoning
-    """
-    # This would typically use an AI model to analyze results and generate new queries
-    # For now, providing a structured approach
-    
-    base_variations = [
-        f"{topic} latest developments",
-        f"{topic} research papers",
-        f"{topic} best practices",
-        f"{topic} case studies",
-        f"{topic} industry trends"
-    ]
-    
-    # Add round-specific variations
-    if round_number == 1:
-        queries = base_variations
-    elif round_number == 2:
-        queries = [
-            f"{topic} tutorials",
-            f"{topic} documentation",
-            f"{topic} expert opinions",
-            f"{topic} implementation guide"
-        ]
-    else:
-        queries = [
-            f"{topic} advanced techniques",
-            f"{topic} future trends",
-            f"{topic} comparison analysis",
-            f"{topic} troubleshooting"
-        ]
-    
-    result = f"""
+# Query suffixes per search round; round 3 onwards reuses the last set
+_ROUND_QUERY_SUFFIXES = {
+    1: ("latest developments", "research papers", "best practices", "case studies", "industry trends"),
+    2: ("tutorials", "documentation", "expert opinions", "implementation guide"),
+}
+_LATER_ROUND_QUERY_SUFFIXES = ("advanced techniques", "future trends", "comparison analysis", "troubleshooting")
+
+# Report layouts are assembled once at import; each call only fills in the fields
+_QUERY_EVOLUTION_TEMPLATE = """
 Evolved Search Queries - Round {round_number}
-{'=' * 50}
+""" + "=" * 50 + """
 Topic: {topic}
-Generation Strategy: {"Initial broad search" if round_number == 1 else "Refined based on previous results"}
+Generation Strategy: {strategy}
 
 Recommended Queries:
-"""
-    
-    for i, query in enumerate(queries, 1):
-        result += f"{i}. {query}\n"
-    
-    result += f"""
+{queries}
 Query Evolution Notes:
-- Round {round_number} focuses on {"foundational content" if round_number == 1 else "specialized content"}
+- Round {round_number} focuses on {focus}
 - Queries designed to avoid duplication with previous rounds
 - Each query targets different aspects of {topic}
 """
-    
-    return result
-
 
-@tool("Search Strategy Planner")
-def plan_search_strategy(topic: str, duration_hours: int = 24, search_frequency: int = 4) -> str:
-    """
-    Plan autonomous search strategy for extended operation.
-    
-    Args:
-        topic: Main research topic
-        duration_hours: How long to run autonomous searches
-        search_frequency: Searches per hour
-    
-    Returns:
-        Detailed search strategy plan
-    """
-    total_searches = duration_hours * search_frequency
-    
-    strategy = f"""
+_SEARCH_STRATEGY_TEMPLATE = """
 Autonomous Search Strategy Plan
-{'=' * 40}
+""" + "=" * 40 + """
 Topic: {topic}
 Duration: {duration_hours} hours
 Frequency: {search_frequency} searches/hour
@@ -195,5 +264,54 @@ Adaptation Strategy:
 - Expand successful search directions
 - Reduce low-yield query types
 """
+
+
+@tool("Query Evolution Tool")
+def evolve_search_queries(previous_results: str, topic: str, round_number: int = 1) -> str:
+    """
+    Generate evolved search queries based on previous results and topic.
+    
+    Args:
+        previous_results: Results from previous search rounds
+        topic: Main topic being researched
+        round_number: Current search round number
+    
+    Returns:
+        List of evolved search queries with reasoning
+    """
+    # This would typically use an AI model to analyze results and generate new queries
+    # For now, providing a structured approach
+    suffixes = _ROUND_QUERY_SUFFIXES.get(round_number, _LATER_ROUND_QUERY_SUFFIXES)
+    queries = "".join(f"{i}. {topic} {suffix}\n" for i, suffix in enumerate(suffixes, 1))
+    
+    initial = round_number == 1
+    return _QUERY_EVOLUTION_TEMPLATE.format(
+        round_number=round_number,
+        topic=topic,
+        strategy="Initial broad search" if initial else "Refined based on previous results",
+        queries=queries,
+        focus="foundational content" if initial else "specialized content"
+    )
+
+
+@tool("Search Strategy Planner")
+def plan_search_strategy(topic: str, duration_hours: int = 24, search_frequency: int = 4) -> str:
+    """
+    Plan autonomous search strategy for extended operation.
+    
+    Args:
+        topic: Main research topic
+        duration_hours: How long to run autonomous searches
+        search_frequency: Searches per hour
+    
+    Returns:
+        Detailed search strategy plan
+    """
+    strategy = _SEARCH_STRATEGY_TEMPLATE.format(
+        topic=topic,
+        duration_hours=duration_hours,
+        search_frequency=search_frequency,
+        total_searches=duration_hours * search_frequency
+    )
     
     return strategy
\ No newline at end of file
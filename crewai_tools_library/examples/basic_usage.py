@@ -5,8 +5,13 @@ This file demonstrates how to use individual tools for common tasks.
 Run this file to see the tools in action with sample data.
 """
 
+import functools
+import io
 import os
+import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import the custom tools
@@ -23,6 +28,42 @@ from crewai_custom_tools import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def shared_tool(tool_class):
+    """
+    Return the one instance of tool_class used by every demonstration.
+    Tools are built on first use and then reused, so construction is paid once per run.
+    """
+    return tool_class()
+
+
+class ThreadBufferedStdout(io.TextIOBase):
+    """
+    Stand-in for sys.stdout that sends each worker thread's output to its own buffer.
+    Lets the demonstrations run side by side without interleaving their prints.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def capture(self, func):
+        """Run func in the calling thread and return everything it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            func()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
 def demonstrate_file_tools():
     """Demonstrate file operation tools."""
     print("=== FILE TOOLS DEMONSTRATION ===\n")
@@ -33,7 +74,7 @@ def demonstrate_file_tools():
         
         # 1. File Writer Tool
         print("1. FileWriterTool - Creating a sample file")
-        writer = FileWriterTool()
+        writer = shared_tool(FileWriterTool)
         sample_file = temp_path / "sample.txt"
         
         sample_content = """
@@ -52,7 +93,7 @@ def demonstrate_file_tools():
         
         # 2. File Reader Tool
         print("2. FileReaderTool - Reading the created file")
-        reader = FileReaderTool()
+        reader = shared_tool(FileReaderTool)
         
         content = reader._run(
             file_path=str(sample_file),
@@ -72,7 +113,7 @@ def demonstrate_file_tools():
         
         # 4. File Validator Tool
         print("3. FileValidatorTool - Validating files")
-        validator = FileValidatorTool()
+        validator = shared_tool(FileValidatorTool)
         
         validation_result = validator._run(
             file_path=str(json_file),
@@ -83,7 +124,7 @@ def demonstrate_file_tools():
         
         # 5. Directory List Tool
         print("4. DirectoryListTool - Listing directory contents")
-        lister = DirectoryListTool()
+        lister = shared_tool(DirectoryListTool)
         
         directory_contents = lister._run(
             directory_path=str(temp_path),
@@ -104,7 +145,7 @@ def demonstrate_web_tools():
     else:
         # 1. Enhanced Search Tool
         print("1. EnhancedSearchTool - Web search")
-        search_tool = EnhancedSearchTool()
+        search_tool = shared_tool(EnhancedSearchTool)
         
         try:
             search_results = search_tool._run(
@@ -118,7 +159,7 @@ def demonstrate_web_tools():
     
     # 2. Web Scraping Tool
     print("2. WebScrapingTool - Extracting content from a webpage")
-    scraper = WebScrapingTool()
+    scraper = shared_tool(WebScrapingTool)
     
     try:
         # Use a simple, reliable website for demonstration
@@ -155,7 +196,7 @@ def demonstrate_text_tools():
     
     # 1. Text Analyzer Tool
     print("1. TextAnalyzerTool - Comprehensive text analysis")
-    analyzer = TextAnalyzerTool()
+    analyzer = shared_tool(TextAnalyzerTool)
     
     analysis_result = analyzer._run(
         text=sample_text,
@@ -165,7 +206,7 @@ def demonstrate_text_tools():
     
     # 2. Text Cleaner Tool
     print("2. TextCleanerTool - Cleaning and normalizing text")
-    cleaner = TextCleanerTool()
+    cleaner = shared_tool(TextCleanerTool)
     
     # Text with extra whitespace and HTML
     messy_text = """
@@ -186,7 +227,7 @@ def demonstrate_text_tools():
     
     # 3. Text Summarizer Tool
     print("3. TextSummarizerTool - Creating text summaries")
-    summarizer = TextSummarizerTool()
+    summarizer = shared_tool(TextSummarizerTool)
     
     summary_result = summarizer._run(
         text=sample_text,
@@ -210,7 +251,7 @@ def demonstrate_error_handling():
     
     # 1. File tool with invalid path
     print("1. Testing FileReaderTool with non-existent file")
-    reader = FileReaderTool()
+    reader = shared_tool(FileReaderTool)
     
     try:
         reader._run(file_path="/non/existent/file.txt")
@@ -219,7 +260,7 @@ def demonstrate_error_handling():
     
     # 2. Text analyzer with empty text
     print("2. Testing TextAnalyzerTool with empty text")
-    analyzer = TextAnalyzerTool()
+    analyzer = shared_tool(TextAnalyzerTool)
     
     try:
         analyzer._run(text="")
@@ -228,7 +269,7 @@ def demonstrate_error_handling():
     
     # 3. Web scraper with invalid URL
     print("3. Testing WebScrapingTool with invalid URL")
-    scraper = WebScrapingTool()
+    scraper = shared_tool(WebScrapingTool)
     
     try:
         scraper._run(url="not-a-valid-url")
@@ -240,7 +281,7 @@ def demonstrate_performance_monitoring():
     """Demonstrate performance monitoring features."""
     print("=== PERFORMANCE MONITORING DEMONSTRATION ===\n")
     
-    # Create a tool and run it multiple times
+    # A dedicated analyzer, so the execution metrics below only count this demonstration's runs
     analyzer = TextAnalyzerTool()
     
     sample_texts = [
@@ -249,10 +290,8 @@ def demonstrate_performance_monitoring():
         "This is a longer text sample that includes multiple paragraphs and various types of content. " * 10
     ]
     
-    print("Running text analysis multiple times...")
-    for i, text in enumerate(sample_texts, 1):
-        print(f"Analysis {i}...")
-        analyzer._run(text=text, analysis_type="basic")
+    print(f"Running text analysis on {len(sample_texts)} texts in one batch...")
+    analyzer._run_batch(sample_texts, "basic")
     
     # Get performance metrics
     metrics = analyzer.get_metrics()
@@ -269,11 +308,25 @@ def main():
     print("=" * 60)
     print()
     
+    # These demonstrations touch disjoint resources, so they run concurrently and the
+    # web demo's network round trips overlap with the local file and text work.
+    # Each one's output is buffered and printed in the usual order once it finishes.
+    independent_demos = [
+        demonstrate_file_tools,
+        demonstrate_web_tools,
+        demonstrate_text_tools,
+        demonstrate_error_handling,
+    ]
+    
+    stdout = sys.stdout
+    buffered_stdout = ThreadBufferedStdout(stdout)
+    sys.stdout = buffered_stdout
     try:
-        demonstrate_file_tools()
-        demonstrate_web_tools()
-        demonstrate_text_tools()
-        demonstrate_error_handling()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(buffered_stdout.capture, demo) for demo in independent_demos]
+            for future in futures:
+                print(future.result(), end="")
+        
         demonstrate_performance_monitoring()
         
         print("=" * 60)
@@ -286,6 +339,8 @@ def main():
     except Exception as e:
         print(f"Demonstration failed: {e}")
         print("Please check your environment setup and dependencies.")
+    finally:
+        sys.stdout = stdout
 
 
 if __name__ == "__main__":
@@ -5,6 +5,11 @@ This example demonstrates how to create a research and analysis crew that uses
 multiple custom tools to gather information, process it, and generate insights.
 """
 
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from dotenv import load_dotenv
@@ -22,6 +27,15 @@ from crewai_custom_tools import (
 # Load environment variables
 load_dotenv()
 
+EXAMPLE_TOPICS = [
+    "Multi-agent AI systems and their applications in business automation",
+]
+
+
+def slugify(text: str) -> str:
+    """Turn a topic into a short, filesystem-safe name."""
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")[:60]
+
 
 @CrewBase
 class ResearchAnalysisCrew:
@@ -170,7 +184,8 @@ class ResearchAnalysisCrew:
             ),
             agent=self.reporter(),
             context=[self.research_task(), self.analysis_task()],
-            output_file="research_report.md",
+            # Per-topic name so concurrent runs do not overwrite each other's output
+            output_file="research_report_{report_slug}.md",
         )
     
     @crew
@@ -184,33 +199,45 @@ class ResearchAnalysisCrew:
         )
 
 
-def run_research_crew_example():
+def run_research_crew_example(topics: Optional[List[str]] = None):
     """
     Run the research crew with sample inputs.
+    
+    All topics share one crew instance, so agents and tools are built once,
+    and the topics are researched concurrently with kickoff_for_each_async.
+    
+    Args:
+        topics: Topics to research; defaults to EXAMPLE_TOPICS
     """
     print("=== CrewAI Custom Tools Integration Example ===\n")
     
-    # Example inputs for the crew
-    inputs = {
-        "topic": "Multi-agent AI systems and their applications in business automation",
-        "reference_files": [],  # No reference files for this example
-        "output_file": "business_ai_research_report.md",
-    }
+    # Example inputs for the crew, one set per topic
+    inputs_list = [
+        {
+            "topic": topic,
+            "reference_files": [],  # No reference files for this example
+            "output_file": f"{slugify(topic)}_research_report.md",
+            "report_slug": slugify(topic),
+        }
+        for topic in (topics or EXAMPLE_TOPICS)
+    ]
     
-    print(f"Starting research on topic: {inputs['topic']}")
-    print(f"Output will be saved to: {inputs['output_file']}")
+    for inputs in inputs_list:
+        print(f"Starting research on topic: {inputs['topic']}")
+        print(f"Output will be saved to: {inputs['output_file']}")
     print("-" * 60)
     
     try:
-        # Create and run the crew
+        # Create the crew once and run it for every topic
         crew = ResearchAnalysisCrew()
-        result = crew.crew().kickoff(inputs=inputs)
+        results = asyncio.run(crew.crew().kickoff_for_each_async(inputs=inputs_list))
         
         print("-" * 60)
         print("✅ Research crew completed successfully!")
-        print(f"📄 Report saved to: {inputs['output_file']}")
-        print("\nFinal result:")
-        print(result)
+        for inputs, result in zip(inputs_list, results):
+            print(f"\n📄 Report for '{inputs['topic']}' saved to: {inputs['output_file']}")
+            print("Final result:")
+            print(result)
         
     except Exception as e:
         print(f"❌ Error running research crew: {e}")
@@ -238,9 +265,14 @@ def demonstrate_tool_performance():
     
     print("Running performance tests...")
     
-    # Run text analysis multiple times
-    for i in range(3):
-        analyzer_tool._run(text=sample_text, analysis_type="basic")
+    # Run text analysis multiple times concurrently, hashing the inputs only once.
+    # The runs are independent, so the metrics reflect throughput under contention.
+    cache_key = analyzer_tool._get_cache_key(text=sample_text, analysis_type="basic")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(
+            lambda _: analyzer_tool._run(text=sample_text, analysis_type="basic", cache_key=cache_key),
+            range(3),
+        ))
     
     # Get and display metrics
     analyzer_metrics = analyzer_tool.get_metrics()
@@ -256,7 +288,7 @@ def demonstrate_tool_performance():
     print(f"  Current cache entries: {analyzer_tool.get_metrics()['cache_entries']}")
     
     # Run the same analysis again (should use cache)
-    analyzer_tool._run(text=sample_text, analysis_type="basic")
+    analyzer_tool._run(text=sample_text, analysis_type="basic", cache_key=cache_key)
     print(f"  Cache entries after repeat: {analyzer_tool.get_metrics()['cache_entries']}")
     
     # Clear cache
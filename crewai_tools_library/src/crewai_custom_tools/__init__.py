@@ -5,25 +5,31 @@ A comprehensive collection of custom tools for CrewAI workflows.
 All tools follow CrewAI best practices for seamless integration.
 """
 
-from .base.tool_base import EnhancedBaseTool
-from .data.file_tools import (
-    FileReaderTool,
-    FileWriterTool,
-    DirectoryListTool,
-    FileValidatorTool,
-)
-from .web.search_tools import (
-    EnhancedSearchTool,
-    WebScrapingTool,
-)
-from .content.text_tools import (
-    TextAnalyzerTool,
-    TextCleanerTool,
-    TextSummarizerTool,
-)
-from .analysis.wolfram_alpha_tool import (
-    WolframAlphaTool,
-)
+import importlib
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Resolved lazily at runtime by __getattr__ below
+    from .base.tool_base import EnhancedBaseTool
+    from .data.file_tools import (
+        FileReaderTool,
+        FileWriterTool,
+        DirectoryListTool,
+        FileValidatorTool,
+    )
+    from .web.search_tools import (
+        EnhancedSearchTool,
+        WebScrapingTool,
+    )
+    from .content.text_tools import (
+        TextAnalyzerTool,
+        TextCleanerTool,
+        TextSummarizerTool,
+    )
+    from .analysis.wolfram_alpha_tool import (
+        WolframAlphaTool,
+    )
 
 __version__ = "0.1.0"
 __author__ = "CrewAI Workspace"
@@ -52,38 +58,116 @@ __all__ = [
     "WolframAlphaTool",
 ]
 
-# Tool registry for easy discovery
-TOOL_REGISTRY = {
-    "data": {
-        "FileReaderTool": FileReaderTool,
-        "FileWriterTool": FileWriterTool,
-        "DirectoryListTool": DirectoryListTool,
-        "FileValidatorTool": FileValidatorTool,
-    },
-    "web": {
-        "EnhancedSearchTool": EnhancedSearchTool,
-        "WebScrapingTool": WebScrapingTool,
-    },
-    "content": {
-        "TextAnalyzerTool": TextAnalyzerTool,
-        "TextCleanerTool": TextCleanerTool,
-        "TextSummarizerTool": TextSummarizerTool,
-    },
-    "analysis": {
-        "WolframAlphaTool": WolframAlphaTool,
-    },
+# Tool names by category, with the module that defines them. Tool modules
+# (and their dependencies such as requests or bs4) are imported on first
+# access, so a script only pays for the tools it actually uses.
+_TOOL_MODULES = {
+    "data": (".data.file_tools", (
+        "FileReaderTool",
+        "FileWriterTool",
+        "DirectoryListTool",
+        "FileValidatorTool",
+    )),
+    "web": (".web.search_tools", (
+        "EnhancedSearchTool",
+        "WebScrapingTool",
+    )),
+    "content": (".content.text_tools", (
+        "TextAnalyzerTool",
+        "TextCleanerTool",
+        "TextSummarizerTool",
+    )),
+    "analysis": (".analysis.wolfram_alpha_tool", (
+        "WolframAlphaTool",
+    )),
 }
 
-def get_tool(category: str, tool_name: str):
-    """Get a tool class by category and name."""
-    if category not in TOOL_REGISTRY:
-        raise ValueError(f"Unknown category: {category}")
-    if tool_name not in TOOL_REGISTRY[category]:
-        raise ValueError(f"Unknown tool: {tool_name} in category: {category}")
-    return TOOL_REGISTRY[category][tool_name]
-
-def list_tools(category: str = None) -> dict:
-    """List available tools, optionally filtered by category."""
-    if category:
-        return TOOL_REGISTRY.get(category, {})
-    return TOOL_REGISTRY
\ No newline at end of file
+_LAZY_IMPORTS = {"EnhancedBaseTool": ".base.tool_base"}
+_LAZY_IMPORTS.update(
+    (tool_name, module)
+    for module, tool_names in _TOOL_MODULES.values()
+    for tool_name in tool_names
+)
+
+# Flat "category.ToolName" -> tool name index, so lookups are a single dict hit
+_TOOL_PATHS = {
+    f"{category}.{tool_name}": tool_name
+    for category, (_, tool_names) in _TOOL_MODULES.items()
+    for tool_name in tool_names
+}
+
+
+def _load(name: str):
+    """Import the module defining name and cache the attribute on this package."""
+    value = globals().get(name)
+    if value is None:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+    return value
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only mapping of category -> {tool name: tool class}.
+    A category's tool module is only imported when that category is looked up,
+    so TOOL_REGISTRY["data"] does not pull in requests or bs4.
+    """
+    
+    def __init__(self):
+        self._categories = {}
+    
+    def __getitem__(self, category: str) -> dict:
+        tools = self._categories.get(category)
+        if tools is None:
+            _, tool_names = _TOOL_MODULES[category]
+            tools = {tool_name: _load(tool_name) for tool_name in tool_names}
+            self._categories[category] = tools
+        return tools
+    
+    def __iter__(self):
+        return iter(_TOOL_MODULES)
+    
+    def __len__(self) -> int:
+        return len(_TOOL_MODULES)
+    
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(_TOOL_MODULES)})"
+
+
+TOOL_REGISTRY = LazyRegistry()
+
+
+def __getattr__(name: str):
+    """Resolve tool classes lazily (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily loaded names in dir() and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+def get_tool(path: str, tool_name: str = None):
+    """
+    Get a tool class by its "category.ToolName" path, e.g. get_tool("data.FileReaderTool").
+    get_tool(category, tool_name) is also accepted.
+    """
+    if tool_name is not None:
+        path = f"{path}.{tool_name}"
+    name = _TOOL_PATHS.get(path)
+    if name is None:
+        raise ValueError(f"Unknown tool: {path}")
+    return _load(name)
+
+def list_tools(prefix: str = None) -> dict:
+    """
+    List available tools as {"category.ToolName": tool class}, optionally
+    limited to one category. Only the matching tool modules are imported.
+    """
+    return {
+        path: _load(name)
+        for path, name in _TOOL_PATHS.items()
+        if prefix is None or path.startswith(prefix + ".")
+    }
\ No newline at end of file
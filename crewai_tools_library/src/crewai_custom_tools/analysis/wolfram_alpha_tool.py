@@ -5,15 +5,75 @@ A custom tool that provides access to Wolfram Alpha's computational knowledge en
 Perfect for mathematical calculations, scientific queries, and data analysis.
 """
 
+import asyncio
+import atexit
+import functools
+import io
 import os
-from typing import Type, Any, Optional
-from pydantic import BaseModel, Field
+import re
+from typing import Type, Any, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel, ConfigDict, Field
 from crewai_tools.tools.base_tool import BaseTool
 from ..base.tool_base import EnhancedBaseTool
 
+# wolframalpha is an optional dependency; imported once here instead of on every query
+try:
+    import wolframalpha
+    import xmltodict  # installed with wolframalpha, which uses it to parse responses
+except ImportError:
+    wolframalpha = None
+
+WOLFRAM_API_URL = "https://api.wolframalpha.com/v2/query"
+
+# Queries in flight at once in WolframAlphaTool.arun_many
+WOLFRAM_CONCURRENCY = 8
+
+# Answers stop collecting pods once they reach this many characters
+WOLFRAM_MAX_OUTPUT_CHARS = 8192
+
+# Pods that repeat the query or the primary result, which is reported separately
+_SKIPPED_POD_TITLES = frozenset({'input', 'input interpretation', 'result'})
+
+# Known failures, recognized in one scan of the error message; the matching
+# group's number selects the message returned to the agent
+_KNOWN_ERROR_PATTERN = re.compile(r"(Invalid appid)|((?i:timeout))")
+_KNOWN_ERROR_MESSAGES = {
+    1: (
+        "Error: Invalid Wolfram Alpha App ID. Please check your WOLFRAM_APP_ID "
+        "environment variable. Get a valid App ID from: https://developer.wolframalpha.com/"
+    ),
+    2: "Error: Query timed out. Please try a simpler query: '{query}'",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_wolfram_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive session for Wolfram Alpha queries.
+    wolframalpha.Client opens a new connection for every query, so queries are
+    sent through this pooled session instead and only pay the TLS handshake once.
+    Transient 429/5xx responses are retried with a short backoff.
+    """
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+    atexit.register(session.close)
+    return session
+
 
 class WolframAlphaToolSchema(BaseModel):
     """Input schema for WolframAlphaTool."""
+    model_config = ConfigDict(
+        extra="forbid",
+        str_strip_whitespace=True,
+        str_max_length=4096,  # Longer queries are rejected before reaching the API
+        frozen=True,
+    )
+    
     query: str = Field(
         ..., 
         description="The query to search in Wolfram Alpha (e.g., 'integrate x^2 from 0 to 10', 'population of Tokyo', 'solve x^2 + 5x + 6 = 0')"
@@ -60,6 +120,22 @@ class WolframAlphaTool(EnhancedBaseTool):
                 "or pass app_id parameter. Get your App ID from: https://developer.wolframalpha.com/"
             )
     
+    def _query(self, query: str):
+        """
+        Send a query over the pooled session.
+        
+        Returns:
+            The parsed queryresult, the same document wolframalpha.Client.query returns
+        """
+        response = get_wolfram_session().get(
+            WOLFRAM_API_URL,
+            params={"input": query, "appid": self.app_id},
+            timeout=30,
+        )
+        response.raise_for_status()
+        document = xmltodict.parse(response.content, postprocessor=wolframalpha.Document.make)
+        return document['queryresult']
+    
     def _run(self, query: str) -> str:
         """
         Execute a query against Wolfram Alpha.
@@ -70,59 +146,87 @@ class WolframAlphaTool(EnhancedBaseTool):
         Returns:
             The result from Wolfram Alpha or an error message
         """
-        try:
-            # Import wolframalpha here to make it an optional dependency
-            import wolframalpha
-        except ImportError:
+        # Repeated queries are answered from the tool cache; only answers are
+        # cached, so errors and empty results are retried on the next call
+        cache_key = self._get_cache_key(query=" ".join(query.split()))
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
+        if wolframalpha is None:
             return (
                 "Error: wolframalpha package not installed. "
                 "Install it with: pip install wolframalpha"
             )
         
         try:
-            # Initialize Wolfram Alpha client
-            client = wolframalpha.Client(self.app_id)
-            
             # Query Wolfram Alpha
-            response = client.query(query)
+            response = self._query(query)
             
             # Check if query was successful
             if not response.get('@success', False):
                 return f"Query failed. Wolfram Alpha could not process: '{query}'"
             
-            # Extract results
-            results = []
+            # Extract results, written straight into one buffer (one line per result)
+            buffer = io.StringIO()
+            write = buffer.write
             
             # Get the primary result
             if hasattr(response, 'results') and response.results:
                 primary_result = next(response.results, None)
                 if primary_result and hasattr(primary_result, 'text'):
-                    results.append(f"Result: {primary_result.text}")
+                    write("Result: ")
+                    write(str(primary_result.text))
             
-            # Get additional pods with useful information
+            # Get additional pods with useful information, until the output budget is spent
             if hasattr(response, 'pods'):
                 for pod in response.pods:
+                    if buffer.tell() >= WOLFRAM_MAX_OUTPUT_CHARS:
+                        break
                     if hasattr(pod, 'title') and hasattr(pod, 'text') and pod.text:
                         # Skip input interpretation and primary result (already captured)
-                        if pod.title.lower() not in ['input', 'input interpretation', 'result']:
-                            results.append(f"{pod.title}: {pod.text}")
+                        if pod.title.lower() not in _SKIPPED_POD_TITLES:
+                            if buffer.tell():
+                                write("\n")
+                            write(pod.title)
+                            write(": ")
+                            write(pod.text)
             
-            if results:
-                return "\n".join(results)
+            answer = buffer.getvalue()
+            if answer:
+                self._cache_result(cache_key, answer)
+                return answer
             else:
                 return f"No results found for query: '{query}'"
                 
         except Exception as e:
             error_msg = str(e)
-            if "Invalid appid" in error_msg:
-                return (
-                    "Error: Invalid Wolfram Alpha App ID. Please check your WOLFRAM_APP_ID "
-                    "environment variable. Get a valid App ID from: https://developer.wolframalpha.com/"
-                )
-            elif "timeout" in error_msg.lower():
-                return f"Error: Query timed out. Please try a simpler query: '{query}'"
-            else:
-                return f"Error querying Wolfram Alpha: {error_msg}"
+            match = _KNOWN_ERROR_PATTERN.search(error_msg)
+            if match:
+                return _KNOWN_ERROR_MESSAGES[match.lastindex].format(query=query)
+            return f"Error querying Wolfram Alpha: {error_msg}"
+    
+    async def arun_many(self, queries: List[str], concurrency: int = WOLFRAM_CONCURRENCY) -> List[str]:
+        """
+        Run several queries concurrently.
+        
+        Each query goes through _run (caching and error reporting included) on a
+        worker thread, so the API round trips overlap instead of adding up.
+        
+        Args:
+            queries: Queries to send to Wolfram Alpha
+            concurrency: Maximum number of queries in flight at once
+            
+        Returns:
+            One result per query, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_query(query: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self._run, query)
+        
+        return list(await asyncio.gather(*(run_query(query) for query in queries)))
 
 
 # Alias for backward compatibility
@@ -2,6 +2,7 @@
 
 from .tool_base import (
     EnhancedBaseTool,
+    ToolRuntime,
     BaseToolInput,
     ToolError,
     ToolValidationError,
@@ -11,6 +12,7 @@ from .tool_base import (
 
 __all__ = [
     "EnhancedBaseTool",
+    "ToolRuntime",
     "BaseToolInput",
     "ToolError",
     "ToolValidationError", 
@@ -2,14 +2,18 @@
 Enhanced base classes for CrewAI tools following best practices.
 """
 
-from typing import Any, Dict, Optional, Type
-from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Optional, Type
+import hashlib
 import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from functools import wraps
-from datetime import datetime, timedelta
 
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToolError(Exception):
@@ -36,12 +40,38 @@ def with_error_handling(func):
         except ToolError:
             raise  # Re-raise tool-specific errors
         except Exception as e:
-            self._log_error(f"Unexpected error in {func.__name__}: {str(e)}")
+            self._log_error("Unexpected error in %s: %s", func.__name__, e)
             raise ToolExecutionError(f"Tool execution failed: {str(e)}")
     return wrapper
 
 
-class EnhancedBaseTool(BaseTool, ABC):
+@dataclass(slots=True)
+class SharedToolCache:
+    """
+    Result cache shared by every instance of one tool, with its settings.
+    TTL and size limit live here rather than on each instance, so all
+    instances agree on when entries expire and how many are kept.
+    """
+    entries: OrderedDict = field(default_factory=OrderedDict)  # Least recently used first
+    ttl_s: float = 30 * 60.0  # Default cache TTL
+    max_entries: Optional[int] = 256  # Default cache size; None means unbounded
+
+
+@dataclass(slots=True)
+class ToolRuntime:
+    """
+    Mutable per-instance state of an EnhancedBaseTool.
+    Kept in one slotted object instead of several attributes in the model's __dict__.
+    """
+    logger: logging.Logger
+    log_prefix: str
+    cache: SharedToolCache  # Shared with other instances of the same tool
+    execution_count: int = 0
+    total_execution_time_ns: int = 0
+    metrics_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class EnhancedBaseTool(BaseTool):
     """
     Enhanced base class for CrewAI tools with additional features:
     - Consistent error handling
@@ -49,27 +79,63 @@ class EnhancedBaseTool(BaseTool, ABC):
     - Logging
     - Caching support
     - Performance metrics
+    
+    Cached results are shared by every instance with the same tool name, so
+    re-creating a tool (as CrewAI task graphs often do) starts with a warm cache.
     """
     
+    # Tool name -> that tool's LRU cache and settings; all of them guarded by _cache_lock
+    _shared_caches: ClassVar[Dict[str, SharedToolCache]] = {}
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init_subclass__(cls, **kwargs):
+        """
+        Require every tool to implement _execute (or replace _run entirely).
+        Checked once when the subclass is defined, instead of through ABC
+        abstract-method bookkeeping.
+        """
+        super().__init_subclass__(**kwargs)
+        if (cls._execute is EnhancedBaseTool._execute
+                and cls._run is EnhancedBaseTool._run):
+            raise TypeError(f"{cls.__name__} must override _execute")
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.execution_count = 0
-        self.total_execution_time = 0.0
-        self._cache = {}
-        self._cache_ttl = timedelta(minutes=30)  # Default cache TTL
+        with self._cache_lock:
+            cache = self._shared_caches.get(self.name)
+            if cache is None:
+                cache = self._shared_caches[self.name] = SharedToolCache()
+        # Set directly on the instance, bypassing pydantic's attribute handling
+        object.__setattr__(self, "_rt", ToolRuntime(
+            logger=logging.getLogger(self.__class__.__name__),
+            log_prefix=f"[{self.__class__.__name__}] ",
+            cache=cache,
+        ))
     
-    def _log_info(self, message: str) -> None:
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger for this tool."""
+        return self._rt.logger
+    
+    # The helpers take %-style arguments, which are only formatted when the
+    # level is enabled, so disabled logging costs no string building.
+    def _log_info(self, message: str, *args: Any) -> None:
         """Log info message."""
-        self.logger.info(f"[{self.__class__.__name__}] {message}")
+        logger = self._rt.logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self._rt.log_prefix + message, *args)
     
-    def _log_error(self, message: str) -> None:
+    def _log_error(self, message: str, *args: Any) -> None:
         """Log error message."""
-        self.logger.error(f"[{self.__class__.__name__}] {message}")
+        logger = self._rt.logger
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(self._rt.log_prefix + message, *args)
     
-    def _log_warning(self, message: str) -> None:
+    def _log_warning(self, message: str, *args: Any) -> None:
         """Log warning message."""
-        self.logger.warning(f"[{self.__class__.__name__}] {message}")
+        logger = self._rt.logger
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(self._rt.log_prefix + message, *args)
     
     def _validate_input(self, **kwargs) -> None:
         """
@@ -85,102 +151,161 @@ class EnhancedBaseTool(BaseTool, ABC):
         """
         return True
     
-    def _get_cache_key(self, **kwargs) -> str:
-        """Generate cache key from input parameters."""
-        return str(sorted(kwargs.items()))
+    def _get_cache_key(self, **kwargs) -> bytes:
+        """
+        Generate cache key from input parameters.
+        The parameters are hashed to a 16-byte digest so large text inputs
+        are not kept around (and compared) as dictionary keys. They are
+        serialized with pickle, which copies strings as-is instead of
+        escaping them character by character like repr().
+        """
+        return hashlib.blake2b(
+            pickle.dumps(sorted(kwargs.items()), protocol=5), digest_size=16
+        ).digest()
     
-    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
+    def _get_cached_result(self, cache_key: bytes) -> Optional[Any]:
         """Get cached result if available and not expired."""
-        if cache_key in self._cache:
-            result, timestamp = self._cache[cache_key]
-            if datetime.now() - timestamp < self._cache_ttl:
+        cache = self._rt.cache
+        with self._cache_lock:
+            entries = cache.entries
+            entry = entries.get(cache_key)
+            if entry is None:
+                return None
+            result, timestamp = entry
+            if time.monotonic() - timestamp < cache.ttl_s:
+                entries.move_to_end(cache_key)
                 return result
-            else:
-                # Remove expired cache entry
-                del self._cache[cache_key]
+            # Remove expired cache entry
+            del entries[cache_key]
         return None
     
-    def _cache_result(self, cache_key: str, result: Any) -> None:
-        """Cache the result with timestamp."""
+    def _cache_result(self, cache_key: bytes, result: Any) -> None:
+        """Cache the result with timestamp, evicting the least recently used entries."""
         if self._should_cache(result):
-            self._cache[cache_key] = (result, datetime.now())
+            cache = self._rt.cache
+            with self._cache_lock:
+                entries = cache.entries
+                entries[cache_key] = (result, time.monotonic())
+                entries.move_to_end(cache_key)
+                if cache.max_entries is not None:
+                    while len(entries) > cache.max_entries:
+                        entries.popitem(last=False)
+    
+    def _record_execution(self, execution_time_ns: int, count: int = 1) -> None:
+        """
+        Add finished executions to the performance metrics.
+        Guarded by a lock so tools shared between threads do not lose updates.
+        
+        Args:
+            execution_time_ns: Elapsed time in nanoseconds, from time.perf_counter_ns()
+            count: Number of executions the time covers
+        """
+        rt = self._rt
+        with rt.metrics_lock:
+            rt.execution_count += count
+            rt.total_execution_time_ns += execution_time_ns
     
-    @abstractmethod
     def _execute(self, **kwargs) -> Any:
         """
         Core execution logic.
         Must be implemented by subclasses.
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement _execute")
     
-    def _run(self, **kwargs) -> Any:
+    def _run(self, cache_key: Optional[bytes] = None, **kwargs) -> Any:
         """
         Main execution method with enhanced features.
+        
+        Args:
+            cache_key: Precomputed key from _get_cache_key, for callers that
+                repeat the same inputs and want to skip hashing them again
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Input validation
             self._validate_input(**kwargs)
             
             # Check cache
-            cache_key = self._get_cache_key(**kwargs)
+            if cache_key is None:
+                cache_key = self._get_cache_key(**kwargs)
             cached_result = self._get_cached_result(cache_key)
             if cached_result is not None:
-                self._log_info(f"Returning cached result for key: {cache_key}")
+                self._log_info("Returning cached result for key: %s", cache_key.hex())
                 return cached_result
             
             # Execute tool logic
-            self._log_info(f"Executing with parameters: {kwargs}")
+            self._log_info("Executing with parameters: %r", kwargs)
             result = self._execute(**kwargs)
             
             # Cache result
             self._cache_result(cache_key, result)
             
             # Update metrics
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.execution_count += 1
-            self.total_execution_time += execution_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            self._record_execution(execution_time_ns)
             
-            self._log_info(f"Execution completed in {execution_time:.2f}s")
+            self._log_info("Execution completed in %.2fs", execution_time_ns / 1e9)
             return result
             
         except ToolError:
             raise  # Re-raise tool-specific errors
         except Exception as e:
-            self._log_error(f"Unexpected error: {str(e)}")
+            self._log_error("Unexpected error: %s", e)
             raise ToolExecutionError(f"Tool execution failed: {str(e)}")
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get performance metrics for this tool."""
+        rt = self._rt
+        with rt.metrics_lock:
+            execution_count = rt.execution_count
+            total_execution_time = rt.total_execution_time_ns / 1e9
         avg_time = (
-            self.total_execution_time / self.execution_count 
-            if self.execution_count > 0 else 0
+            total_execution_time / execution_count 
+            if execution_count > 0 else 0
         )
         return {
-            "execution_count": self.execution_count,
-            "total_execution_time": self.total_execution_time,
+            "execution_count": execution_count,
+            "total_execution_time": total_execution_time,
             "average_execution_time": avg_time,
-            "cache_entries": len(self._cache),
+            "cache_entries": len(rt.cache.entries),
         }
     
     def clear_cache(self) -> None:
-        """Clear the tool's cache."""
-        self._cache.clear()
+        """Clear the cache shared by all instances of this tool."""
+        with self._cache_lock:
+            self._rt.cache.entries.clear()
         self._log_info("Cache cleared")
     
     def set_cache_ttl(self, minutes: int) -> None:
-        """Set cache time-to-live in minutes."""
-        self._cache_ttl = timedelta(minutes=minutes)
-        self._log_info(f"Cache TTL set to {minutes} minutes")
+        """Set cache time-to-live in minutes, for all instances of this tool."""
+        with self._cache_lock:
+            self._rt.cache.ttl_s = minutes * 60.0
+        self._log_info("Cache TTL set to %s minutes", minutes)
+    
+    def set_cache_size(self, max_entries: Optional[int]) -> None:
+        """
+        Set the maximum number of cached results for all instances of this tool;
+        None removes the limit.
+        """
+        cache = self._rt.cache
+        with self._cache_lock:
+            cache.max_entries = max_entries
+            if max_entries is not None:
+                while len(cache.entries) > max_entries:
+                    cache.entries.popitem(last=False)
+        self._log_info("Cache size set to %s entries", max_entries)
 
 
 class BaseToolInput(BaseModel):
     """Base input schema with common validation."""
     
-    class Config:
-        extra = "forbid"  # Prevent extra fields
-        str_strip_whitespace = True  # Auto-strip whitespace
+    model_config = ConfigDict(
+        extra="forbid",  # Prevent extra fields
+        str_strip_whitespace=True,  # Auto-strip whitespace
+        frozen=True,  # Inputs are read-only once validated
+        validate_assignment=False,
+    )
     
     def validate_required_fields(self, required_fields: list) -> None:
         """Validate that required fields are present and not empty."""
@@ -2,13 +2,84 @@
 Text processing and analysis tools for CrewAI workflows.
 """
 
+import functools
+import heapq
 import re
 import string
+import time
 from collections import Counter
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field, validator
 
-from ..base import EnhancedBaseTool, BaseToolInput, ToolValidationError, ToolExecutionError
+from ..base import (
+    EnhancedBaseTool,
+    BaseToolInput,
+    ToolValidationError,
+    ToolExecutionError,
+    with_error_handling,
+)
+
+
+# Patterns used by TextAnalyzerTool, compiled once for every call and batch
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_ALPHA_WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+_VOWEL_GROUP_PATTERN = re.compile(r'[aeiouy]+')
+_PUNCTUATION_DELETE_TABLE = str.maketrans('', '', string.punctuation)
+
+# TextCleanerTool options that delete every match, in the order they take precedence
+_REMOVAL_OPTIONS = (
+    ("html", r'<[^>]+>', "Removed HTML tags"),
+    ("urls", _URL_PATTERN.pattern, "Removed URLs"),
+    ("emails", _EMAIL_PATTERN.pattern, "Removed email addresses"),
+    ("numbers", r'\b\d+(?:\.\d+)?\b', "Removed numbers"),
+)
+_SPECIAL_CHARS_PATTERNS = {
+    True: r'[^\w\s.!?,;:\n\-]',  # Keep basic punctuation and structure
+    False: r'[^\w\s]',  # Remove all special characters
+}
+_REPEATED_PUNCTUATION_PATTERN = re.compile(r'([.!?,])\1+')
+_HORIZONTAL_SPACE_PATTERN = re.compile(r'[ \t]+')
+_BLANK_LINE_PATTERN = re.compile(r'\n[ \t]*\n')
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
+# TextSummarizerTool scoring vocabulary
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+_SUMMARY_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
+})
+_KEY_POINT_INDICATORS = frozenset({
+    'important', 'key', 'main', 'primary', 'essential', 'crucial',
+    'significant', 'major', 'critical', 'fundamental', 'central',
+    'first', 'second', 'third', 'finally', 'conclusion', 'result',
+    'therefore', 'thus', 'however', 'moreover', 'furthermore'
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _removal_pattern(cleaning_options: FrozenSet[str], preserve_structure: bool) -> Optional[re.Pattern]:
+    """Combine the selected removal options into one alternation so they share a single pass."""
+    parts = [pattern for option, pattern, _ in _REMOVAL_OPTIONS if option in cleaning_options]
+    if "special_chars" in cleaning_options:
+        parts.append(_SPECIAL_CHARS_PATTERNS[preserve_structure])
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{part})" for part in parts))
+
+
+@functools.lru_cache(maxsize=32)
+def _split_sentences(text: str) -> Tuple[str, ...]:
+    """
+    Split text into stripped, non-empty sentences.
+    Memoized because the summarizer splits the same text to validate it and
+    again to summarize it, often once per summary type.
+    """
+    return tuple(s.strip() for s in _SENTENCE_SPLIT_PATTERN.split(text) if s.strip())
 
 
 class TextAnalyzerInput(BaseToolInput):
@@ -65,13 +136,50 @@ class TextAnalyzerTool(EnhancedBaseTool):
         except Exception as e:
             raise ToolExecutionError(f"Text analysis failed: {str(e)}")
     
+    @with_error_handling
+    def _run_batch(self, texts: List[str], analysis_type: str = "comprehensive") -> List[str]:
+        """
+        Analyze several texts in one call.
+        
+        All texts are validated before any work starts, results are cached per
+        text exactly as with _run, and the metrics are updated once for the batch.
+        
+        Args:
+            texts: Texts to analyze
+            analysis_type: Type of analysis applied to every text
+            
+        Returns:
+            One analysis result per text, in input order
+        """
+        start_ns = time.perf_counter_ns()
+        
+        for text in texts:
+            self._validate_input(text=text, analysis_type=analysis_type)
+        
+        results = []
+        executed = 0
+        for text in texts:
+            cache_key = self._get_cache_key(text=text, analysis_type=analysis_type)
+            result = self._get_cached_result(cache_key)
+            if result is None:
+                result = self._execute(text=text, analysis_type=analysis_type)
+                self._cache_result(cache_key, result)
+                executed += 1
+            results.append(result)
+        
+        execution_time_ns = time.perf_counter_ns() - start_ns
+        self._record_execution(execution_time_ns, count=executed)
+        
+        self._log_info("Batch of %d texts completed in %.2fs", len(texts), execution_time_ns / 1e9)
+        return results
+    
     def _basic_analysis(self, text: str) -> str:
         """Perform basic text analysis."""
         # Basic counts
         char_count = len(text)
-        char_count_no_spaces = len(text.replace(' ', ''))
+        char_count_no_spaces = char_count - text.count(' ')
         word_count = len(text.split())
-        sentence_count = len([s for s in re.split(r'[.!?]+', text) if s.strip()])
+        sentence_count = len([s for s in _SENTENCE_SPLIT_PATTERN.split(text) if s.strip()])
         paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
         
         result = [
@@ -96,7 +204,7 @@ class TextAnalyzerTool(EnhancedBaseTool):
         
         # Additional analysis
         words = text.lower().split()
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = [s.strip() for s in _SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
         
         # Word frequency
         word_freq = Counter(words)
@@ -160,18 +268,15 @@ class TextAnalyzerTool(EnhancedBaseTool):
         # Lexical diversity
         lexical_diversity = len(unique_words) / max(len(words), 1)
         
-        # Punctuation analysis
-        punctuation_count = sum(1 for char in text if char in string.punctuation)
+        # Punctuation analysis (whatever translate() deletes is punctuation)
+        punctuation_count = len(text) - len(text.translate(_PUNCTUATION_DELETE_TABLE))
         
         # Capitalization analysis
-        uppercase_count = sum(1 for char in text if char.isupper())
+        uppercase_count = sum(map(str.isupper, text))
         
         # Pattern analysis
-        url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        
-        urls_found = len(url_pattern.findall(text))
-        emails_found = len(email_pattern.findall(text))
+        urls_found = len(_URL_PATTERN.findall(text))
+        emails_found = len(_EMAIL_PATTERN.findall(text))
         
         # Text complexity indicators
         long_words = [word for word in words if len(word) > 6]
@@ -201,17 +306,18 @@ class TextAnalyzerTool(EnhancedBaseTool):
     
     def _estimate_syllables_per_word(self, text: str) -> float:
         """Estimate average syllables per word (simplified method)."""
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = _ALPHA_WORD_PATTERN.findall(text.lower())
         if not words:
             return 0
         
+        # Count each distinct word once and weight it by how often it occurs
         total_syllables = 0
-        for word in words:
+        for word, occurrences in Counter(words).items():
             # Simple syllable counting heuristic
-            syllables = max(1, len(re.findall(r'[aeiouy]+', word)))
+            syllables = max(1, len(_VOWEL_GROUP_PATTERN.findall(word)))
             if word.endswith('e'):
                 syllables -= 1
-            total_syllables += max(1, syllables)
+            total_syllables += max(1, syllables) * occurrences
         
         return total_syllables / len(words)
 
@@ -268,27 +374,20 @@ class TextCleanerTool(EnhancedBaseTool):
             cleaned_text = text
             applied_operations = []
             
-            # Apply cleaning operations in order
-            if "html" in cleaning_options:
-                cleaned_text = self._remove_html(cleaned_text)
-                applied_operations.append("Removed HTML tags")
-            
-            if "urls" in cleaning_options:
-                cleaned_text = self._remove_urls(cleaned_text)
-                applied_operations.append("Removed URLs")
+            # Removal options all delete their matches, so they are applied
+            # together in one left-to-right pass over the text
+            removal_pattern = _removal_pattern(frozenset(cleaning_options), preserve_structure)
+            if removal_pattern is not None:
+                cleaned_text = removal_pattern.sub('', cleaned_text)
             
-            if "emails" in cleaning_options:
-                cleaned_text = self._remove_emails(cleaned_text)
-                applied_operations.append("Removed email addresses")
-            
-            if "numbers" in cleaning_options:
-                cleaned_text = self._remove_numbers(cleaned_text)
-                applied_operations.append("Removed numbers")
+            for option, _, operation in _REMOVAL_OPTIONS:
+                if option in cleaning_options:
+                    applied_operations.append(operation)
             
             if "special_chars" in cleaning_options:
-                cleaned_text = self._remove_special_chars(cleaned_text, preserve_structure)
                 applied_operations.append("Removed special characters")
             
+            # Remaining operations rewrite rather than delete, and run in order
             if "punctuation" in cleaning_options:
                 cleaned_text = self._clean_punctuation(cleaned_text, preserve_structure)
                 applied_operations.append("Cleaned punctuation")
@@ -323,44 +422,14 @@ class TextCleanerTool(EnhancedBaseTool):
         except Exception as e:
             raise ToolExecutionError(f"Text cleaning failed: {str(e)}")
     
-    def _remove_html(self, text: str) -> str:
-        """Remove HTML tags."""
-        return re.sub(r'<[^>]+>', '', text)
-    
-    def _remove_urls(self, text: str) -> str:
-        """Remove URLs."""
-        url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
-        return url_pattern.sub('', text)
-    
-    def _remove_emails(self, text: str) -> str:
-        """Remove email addresses."""
-        email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        return email_pattern.sub('', text)
-    
-    def _remove_numbers(self, text: str) -> str:
-        """Remove numbers."""
-        return re.sub(r'\b\d+(?:\.\d+)?\b', '', text)
-    
-    def _remove_special_chars(self, text: str, preserve_structure: bool) -> str:
-        """Remove special characters."""
-        if preserve_structure:
-            # Keep basic punctuation and structure
-            return re.sub(r'[^\w\s.!?,;:\n\-]', '', text)
-        else:
-            # Remove all special characters
-            return re.sub(r'[^\w\s]', '', text)
-    
     def _clean_punctuation(self, text: str, preserve_structure: bool) -> str:
         """Clean and normalize punctuation."""
         if preserve_structure:
-            # Fix multiple punctuation marks
-            text = re.sub(r'[.]{2,}', '.', text)
-            text = re.sub(r'[!]{2,}', '!', text)
-            text = re.sub(r'[?]{2,}', '?', text)
-            text = re.sub(r'[,]{2,}', ',', text)
+            # Collapse runs of the same mark (.., !!, ??, ,,) to a single one
+            text = _REPEATED_PUNCTUATION_PATTERN.sub(r'\1', text)
         else:
             # Remove all punctuation
-            text = text.translate(str.maketrans('', '', string.punctuation))
+            text = text.translate(_PUNCTUATION_DELETE_TABLE)
         
         return text
     
@@ -368,12 +437,12 @@ class TextCleanerTool(EnhancedBaseTool):
         """Normalize whitespace."""
         if preserve_structure:
             # Normalize spaces but keep paragraph breaks
-            text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces/tabs to single space
-            text = re.sub(r'\n[ \t]*\n', '\n\n', text)  # Clean paragraph breaks
-            text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 newlines
+            text = _HORIZONTAL_SPACE_PATTERN.sub(' ', text)  # Multiple spaces/tabs to single space
+            text = _BLANK_LINE_PATTERN.sub('\n\n', text)  # Clean paragraph breaks
+            text = _EXCESS_NEWLINES_PATTERN.sub('\n\n', text)  # Max 2 newlines
         else:
             # All whitespace to single spaces
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RUN_PATTERN.sub(' ', text)
         
         return text.strip()
 
@@ -425,7 +494,7 @@ class TextSummarizerTool(EnhancedBaseTool):
             raise ToolValidationError("Text cannot be empty")
         
         # Check if text has enough sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = _split_sentences(text)
         if len(sentences) < 2:
             raise ToolValidationError("Text must contain at least 2 sentences for summarization")
     
@@ -447,36 +516,26 @@ class TextSummarizerTool(EnhancedBaseTool):
     def _extractive_summary(self, text: str, max_sentences: int) -> str:
         """Create extractive summary using sentence scoring."""
         # Split into sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = _split_sentences(text)
         
         if len(sentences) <= max_sentences:
             return f"Original text is already short ({len(sentences)} sentences):\n\n" + text
         
         # Calculate word frequencies
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_PATTERN.findall(text.lower())
         word_freq = Counter(words)
         
         # Remove very common words (simple stopwords)
-        stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
-        }
-        
         filtered_freq = {word: freq for word, freq in word_freq.items() 
-                        if word not in stopwords and len(word) > 2}
+                        if word not in _SUMMARY_STOPWORDS and len(word) > 2}
         
         # Score sentences
         sentence_scores = []
         for i, sentence in enumerate(sentences):
-            words_in_sentence = re.findall(r'\b\w+\b', sentence.lower())
-            score = 0
+            words_in_sentence = _WORD_PATTERN.findall(sentence.lower())
             
             # Word frequency score
-            for word in words_in_sentence:
-                if word in filtered_freq:
-                    score += filtered_freq[word]
+            score = sum(filtered_freq.get(word, 0) for word in words_in_sentence)
             
             # Position score (first and last sentences get bonus)
             if i == 0 or i == len(sentences) - 1:
@@ -488,9 +547,8 @@ class TextSummarizerTool(EnhancedBaseTool):
             
             sentence_scores.append((score, i, sentence))
         
-        # Select top sentences
-        sentence_scores.sort(reverse=True)
-        selected = sentence_scores[:max_sentences]
+        # Select top sentences without sorting the whole list
+        selected = heapq.nlargest(max_sentences, sentence_scores)
         
         # Sort by original order
         selected.sort(key=lambda x: x[1])
@@ -512,16 +570,9 @@ class TextSummarizerTool(EnhancedBaseTool):
     
     def _key_points_summary(self, text: str, max_points: int) -> str:
         """Extract key points from text."""
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = _split_sentences(text)
         
         # Look for sentences with key indicators
-        key_indicators = [
-            'important', 'key', 'main', 'primary', 'essential', 'crucial',
-            'significant', 'major', 'critical', 'fundamental', 'central',
-            'first', 'second', 'third', 'finally', 'conclusion', 'result',
-            'therefore', 'thus', 'however', 'moreover', 'furthermore'
-        ]
-        
         scored_sentences = []
         for i, sentence in enumerate(sentences):
             score = 0
@@ -529,7 +580,7 @@ class TextSummarizerTool(EnhancedBaseTool):
             
             # Check for key indicators
             for word in words:
-                if word in key_indicators:
+                if word in _KEY_POINT_INDICATORS:
                     score += 2
             
             # Length score (prefer medium-length sentences)
@@ -542,9 +593,8 @@ class TextSummarizerTool(EnhancedBaseTool):
             
             scored_sentences.append((score, sentence))
         
-        # Sort by score and select top points
-        scored_sentences.sort(reverse=True)
-        key_points = [sentence for _, sentence in scored_sentences[:max_points]]
+        # Select top points by score
+        key_points = [sentence for _, sentence in heapq.nlargest(max_points, scored_sentences)]
         
         result = [
             f"=== KEY POINTS SUMMARY ({max_points} points) ===",
@@ -5,6 +5,7 @@ File operation tools for CrewAI workflows.
 import os
 import json
 import csv
+import stat
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
@@ -12,6 +13,54 @@ from pydantic import BaseModel, Field
 from ..base import EnhancedBaseTool, BaseToolInput, ToolValidationError, ToolExecutionError
 
 
+# Syntax-only JSON check: every object collapses to None as soon as it is
+# decoded, so validating a large document never builds its nested dicts
+_JSON_SYNTAX_CHECKER = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+
+# Files above this size are read with a sequential-access hint to the kernel
+_SEQUENTIAL_READ_HINT_BYTES = 2 * 1024 * 1024
+
+
+def _read_file_bytes(path: Union[str, Path]) -> bytes:
+    """
+    Read a whole file with one fstat and, normally, a single read call.
+    Buffered text-mode reads spend extra syscalls on small reads and probing.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > _SEQUENTIAL_READ_HINT_BYTES and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        # Asking for one byte more than expected means a short read marks EOF
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # The file changed size since fstat (or the read was capped); read to EOF
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1024 * 1024)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _path_stamp(path: Optional[str]) -> Optional[tuple]:
+    """
+    Return (mtime_ns, size) of a path, or None if it cannot be stat'ed.
+    Added to the cache keys of tools that report on a file's contents, so a
+    cached result is not served after the file changes.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 class FileReaderInput(BaseToolInput):
     """Input schema for FileReaderTool."""
     file_path: str = Field(..., description="Path to the file to read")
@@ -41,22 +90,26 @@ class FileReaderTool(EnhancedBaseTool):
         if not file_path:
             raise ToolValidationError("file_path is required")
         
-        path = Path(file_path)
-        
-        # Check if file exists
-        if not path.exists():
+        # One stat answers existence, type and size
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             raise ToolValidationError(f"File does not exist: {file_path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise ToolValidationError(f"Path is not a file: {file_path}")
         
         # Check file size
-        file_size_mb = path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         if file_size_mb > max_size_mb:
             raise ToolValidationError(
                 f"File too large: {file_size_mb:.2f}MB > {max_size_mb}MB limit"
             )
     
+    def _get_cache_key(self, **kwargs) -> bytes:
+        """Key on the file's current mtime and size too, so edited files are read again."""
+        return super()._get_cache_key(file_stamp=_path_stamp(kwargs.get("file_path")), **kwargs)
+    
     def _execute(self, **kwargs) -> str:
         """Execute file reading."""
         file_path = kwargs["file_path"]
@@ -83,15 +136,16 @@ class FileReaderTool(EnhancedBaseTool):
     
     def _read_text(self, path: Path, encoding: str) -> str:
         """Read plain text file."""
-        with open(path, 'r', encoding=encoding) as f:
-            content = f.read()
+        content = _read_file_bytes(path).decode(encoding)
+        if '\r' in content:
+            # Match text-mode reads, which translate \r\n and \r to \n
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         return f"File: {path.name}\nContent:\n{content}"
     
     def _read_json(self, path: Path, encoding: str) -> str:
         """Read and format JSON file."""
-        with open(path, 'r', encoding=encoding) as f:
-            data = json.load(f)
+        data = json.loads(_read_file_bytes(path).decode(encoding))
         
         formatted_json = json.dumps(data, indent=2, ensure_ascii=False)
         return f"JSON File: {path.name}\n{formatted_json}"
@@ -163,6 +217,10 @@ class FileWriterTool(EnhancedBaseTool):
         if not path.parent.exists():
             raise ToolValidationError(f"Parent directory does not exist: {path.parent}")
     
+    def _should_cache(self, result: Any, **kwargs) -> bool:
+        """Never cache writes; a cached result would skip writing the file."""
+        return False
+    
     def _execute(self, **kwargs) -> str:
         """Execute file writing."""
         file_path = kwargs["file_path"]
@@ -170,12 +228,18 @@ class FileWriterTool(EnhancedBaseTool):
         encoding = kwargs.get("encoding", "utf-8")
         
         try:
-            path = Path(file_path)
-            with open(path, 'w', encoding=encoding) as f:
-                f.write(content)
+            # Encode once and hand the bytes straight to the OS; the byte count
+            # is known up front, so no stat is needed after writing
+            data = memoryview(content.encode(encoding))
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                written = 0
+                while written < len(data):
+                    written += os.write(fd, data[written:])
+            finally:
+                os.close(fd)
             
-            file_size = path.stat().st_size
-            return f"Successfully wrote {len(content)} characters ({file_size} bytes) to {file_path}"
+            return f"Successfully wrote {len(content)} characters ({len(data)} bytes) to {file_path}"
             
         except Exception as e:
             raise ToolExecutionError(f"Failed to write file: {str(e)}")
@@ -211,14 +275,18 @@ class DirectoryListTool(EnhancedBaseTool):
         if not directory_path:
             raise ToolValidationError("directory_path is required")
         
-        path = Path(directory_path)
-        
-        if not path.exists():
+        try:
+            dir_stat = os.stat(directory_path)
+        except OSError:
             raise ToolValidationError(f"Directory does not exist: {directory_path}")
         
-        if not path.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise ToolValidationError(f"Path is not a directory: {directory_path}")
     
+    def _should_cache(self, result: Any, **kwargs) -> bool:
+        """Listings are not cached, since files in the directory can change at any time."""
+        return False
+    
     def _execute(self, **kwargs) -> str:
         """Execute directory listing."""
         directory_path = kwargs["directory_path"]
@@ -226,29 +294,34 @@ class DirectoryListTool(EnhancedBaseTool):
         file_types = kwargs.get("file_types")
         
         try:
-            path = Path(directory_path)
             items = []
+            allowed_suffixes = {ft.lower() for ft in file_types} if file_types else None
             
-            for item in path.iterdir():
-                # Skip hidden files if not requested
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
-                # Filter by file types if specified
-                if file_types and item.is_file():
-                    if item.suffix.lower() not in [ft.lower() for ft in file_types]:
+            # scandir reports each entry's type from the directory read itself,
+            # so only files need a stat call (for their size)
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    # Skip hidden files if not requested
+                    if not include_hidden and entry.name.startswith('.'):
                         continue
-                
-                # Get item info
-                if item.is_dir():
-                    item_type = "DIR"
-                    size_info = ""
-                else:
-                    item_type = "FILE"
-                    size = item.stat().st_size
-                    size_info = f" ({size} bytes)"
-                
-                items.append(f"{item_type}: {item.name}{size_info}")
+                    
+                    is_dir = entry.is_dir()
+                    
+                    # Filter by file types if specified
+                    if allowed_suffixes is not None and entry.is_file():
+                        if os.path.splitext(entry.name)[1].lower() not in allowed_suffixes:
+                            continue
+                    
+                    # Get item info
+                    if is_dir:
+                        item_type = "DIR"
+                        size_info = ""
+                    else:
+                        item_type = "FILE"
+                        size = entry.stat().st_size
+                        size_info = f" ({size} bytes)"
+                    
+                    items.append(f"{item_type}: {entry.name}{size_info}")
             
             if not items:
                 return f"Directory '{directory_path}' is empty (with current filters)"
@@ -289,6 +362,10 @@ class FileValidatorTool(EnhancedBaseTool):
     )
     args_schema: type[BaseModel] = FileValidatorInput
     
+    def _get_cache_key(self, **kwargs) -> bytes:
+        """Key on the file's current mtime and size too, so edited files are validated again."""
+        return super()._get_cache_key(file_stamp=_path_stamp(kwargs.get("file_path")), **kwargs)
+    
     def _execute(self, **kwargs) -> str:
         """Execute file validation."""
         file_path = kwargs["file_path"]
@@ -298,11 +375,13 @@ class FileValidatorTool(EnhancedBaseTool):
         path = Path(file_path)
         validation_results = []
         
-        # Basic existence check
-        if not path.exists():
+        # Basic existence check; the stat is reused for the size report below
+        try:
+            file_stat = path.stat()
+        except OSError:
             return f"INVALID: File does not exist: {file_path}"
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return f"INVALID: Path is not a file: {file_path}"
         
         validation_results.append("✓ File exists")
@@ -322,7 +401,7 @@ class FileValidatorTool(EnhancedBaseTool):
             validation_results.append(content_result)
         
         # File size info
-        file_size = path.stat().st_size
+        file_size = file_stat.st_size
         validation_results.append(f"ℹ File size: {file_size} bytes ({file_size / 1024:.2f} KB)")
         
         status = "VALID" if all("✗" not in result for result in validation_results) else "INVALID"
@@ -335,7 +414,7 @@ class FileValidatorTool(EnhancedBaseTool):
         try:
             if extension == ".json":
                 with open(path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                    _JSON_SYNTAX_CHECKER.decode(f.read())
                 return "✓ Valid JSON syntax"
             
             elif extension == ".csv":
@@ -2,14 +2,124 @@
 Enhanced web search and scraping tools for CrewAI workflows.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 from pydantic import BaseModel, Field, validator
 import time
 
-from ..base import EnhancedBaseTool, BaseToolInput, ToolValidationError, ToolExecutionError
+try:
+    import lxml  # noqa: F401  (optional, from the "fast" extra)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+from ..base import EnhancedBaseTool, BaseToolInput, ToolError, ToolValidationError, ToolExecutionError
+
+
+# Pages fetched at once by WebScrapingTool.arun_many
+SCRAPE_CONCURRENCY = 8
+
+# Lifetime of cached Serper responses; empty responses expire sooner
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "3600"))
+SEARCH_CACHE_EMPTY_TTL = 300
+
+
+class SearchResultCache:
+    """
+    SQLite-backed cache of raw search API responses with a time-to-live.
+    Persists across runs, so repeated queries do not hit the paid API again.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            # Drop what expired since the last run so the file does not grow unbounded
+            self._conn.execute("DELETE FROM search_cache WHERE expires < ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value, expires FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning("Could not read search cache: %s", e)
+                return None
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Dict, ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time() + ttl_seconds),
+                )
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                self.logger.warning("Could not write search cache: %s", e)
+
+
+search_result_cache = SearchResultCache(
+    Path(os.getenv("SEARCH_CACHE_DIR", ".crewai_search_cache")) / "search_cache.sqlite3"
+)
+
+
+# Extraction modes that only need one tag type parse just those tags
+_PARSE_ONLY = {
+    "links": SoupStrainer("a"),
+    "images": SoupStrainer("img"),
+}
+
+SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (CrewAI Custom Tool) Web Scraper',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive session shared by the web tools.
+    Repeated requests to the same host reuse pooled connections instead of
+    paying a new TCP/TLS handshake each time.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=2 * SCRAPE_CONCURRENCY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
 
 
 class EnhancedSearchInput(BaseToolInput):
@@ -53,7 +163,6 @@ class EnhancedSearchTool(EnhancedBaseTool):
         self.base_url = "https://google.serper.dev"
         
         # Try to get API key from environment
-        import os
         self.api_key = os.getenv("SERPER_API_KEY")
         if not self.api_key:
             self._log_warning("SERPER_API_KEY not found in environment variables")
@@ -99,11 +208,25 @@ class EnhancedSearchTool(EnhancedBaseTool):
             elif search_type == "images":
                 payload["type"] = "images"
             
-            # Make API request
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
+            # Serve repeated searches from the on-disk cache before calling the API
+            cache_key = hashlib.blake2b(
+                json.dumps([query, num_results, search_type, country]).encode("utf-8"),
+                digest_size=16,
+            ).hexdigest()
+            data = search_result_cache.get(cache_key)
             
-            data = response.json()
+            if data is None:
+                # Make API request
+                response = get_http_session().post(endpoint, json=payload, headers=headers, timeout=30)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                # Empty responses are cached briefly so retries within a run stay offline
+                has_results = any(data.get(field) for field in ("organic", "news", "images"))
+                search_result_cache.set(
+                    cache_key, data, SEARCH_CACHE_TTL if has_results else SEARCH_CACHE_EMPTY_TTL
+                )
             
             # Format results
             return self._format_search_results(data, search_type, query)
@@ -230,19 +353,14 @@ class WebScrapingTool(EnhancedBaseTool):
         max_length = kwargs.get("max_length", 5000)
         
         try:
-            # Set up session with headers
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (CrewAI Custom Tool) Web Scraper',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            })
-            
-            # Fetch the page
-            response = session.get(url, timeout=30)
+            # Fetch the page over the shared pooled session
+            response = get_http_session().get(url, headers=SCRAPER_HEADERS, timeout=30)
             response.raise_for_status()
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse with BeautifulSoup, skipping tags the extraction mode ignores
+            soup = BeautifulSoup(
+                response.content, HTML_PARSER, parse_only=_PARSE_ONLY.get(extract_type)
+            )
             
             # Extract based on type
             if extract_type == "text":
@@ -263,6 +381,37 @@ class WebScrapingTool(EnhancedBaseTool):
         except Exception as e:
             raise ToolExecutionError(f"Scraping failed: {str(e)}")
     
+    async def arun_many(
+        self, urls: List[str], extract_type: str = "text", max_length: int = 5000
+    ) -> List[str]:
+        """
+        Scrape several URLs concurrently.
+        
+        Each URL goes through _run (validation, caching and metrics) on a worker
+        thread, so the network waits overlap instead of adding up. A URL that
+        fails yields an error message in its slot rather than aborting the batch.
+        
+        Args:
+            urls: URLs to scrape
+            extract_type: What to extract from every page
+            max_length: Maximum length of each page's extracted content
+            
+        Returns:
+            One result per URL, in input order
+        """
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+        
+        async def scrape(url: str) -> str:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self._run, url=url, extract_type=extract_type, max_length=max_length
+                    )
+                except ToolError as e:
+                    return f"Failed to scrape {url}: {str(e)}"
+        
+        return list(await asyncio.gather(*(scrape(url) for url in urls)))
+    
     def _extract_text(self, soup: BeautifulSoup, max_length: int) -> str:
         """Extract clean text content."""
         # Remove script and style elements